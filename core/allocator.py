@@ -1,10 +1,11 @@
 __all__ = ["Allocator"]
 
 
-import threading
 import itertools
-from collections import defaultdict
-from typing import Dict, Tuple, Set
+import threading
+from typing import Dict, List, Optional, Tuple
+
+SHARDS = 16
 
 
 class Allocator:
@@ -15,42 +16,123 @@ class Allocator:
     - Assigns a unique client ID to each (IP, port) pair.
     - Maintains a session ID counter for each client ID, which increments automatically.
     - Provides methods to release client IDs and session IDs for resource management.
+
+    Client ID state is split into ``SHARDS`` independent shards, each with its
+    own lock, address map and pool, so unrelated (IP, port) pairs do not
+    contend on a single lock. An address is routed to shard
+    ``hash(local) % SHARDS`` and shard ``i`` only hands out client IDs with
+    ``client_id % SHARDS == i``. Once a shard has no free ID left, the other
+    shards are searched, so allocation only fails when every ID is taken; such
+    a borrowed ID is returned to the shard that owns it on release.
+
+    Each shard pool is a bitmap held in a single int: bit ``k`` set means client
+    ID ``k * SHARDS + i`` is free. Allocation takes the lowest set bit, so IDs
+    are handed out in ascending order, and a reset is a single assignment.
+
+    Shard locks are plain ``threading.Lock`` objects: no method re-acquires a
+    shard lock it already holds, so the owner bookkeeping of a re-entrant lock
+    is not needed.
     """
 
     def __init__(self):
         """
         Initializes the Allocator.
 
-        - Maintains a pool of client IDs (range: 1 to 0xFFFF).
-        - Stores a mapping from (IP, port) to client IDs.
-        - Stores a mapping from client IDs to session ID counters.
+        - Maintains one lock per shard.
+        - Maintains one free-ID bitmap per shard (range: 1 to 0xFFFF, split by residue).
+        - Stores one mapping from (IP, port) to client IDs per shard.
+        - Stores a table of session ID counters indexed by client ID.
         """
-        self.__lock = threading.RLock()
-        self.__client_pool: Set[int] = set(range(1, 0xFFFF))
-        self.__address_client_map: Dict[Tuple[str, int], int] = dict()
-        self.__client_session_map: Dict[int, itertools.count] = defaultdict(
-            lambda: itertools.count(start=1)
+        self.__locks: Tuple[threading.Lock, ...] = tuple(
+            threading.Lock() for _ in range(SHARDS)
         )
+        self.__free_bits: List[int] = [
+            self.initial_free_bits(shard) for shard in range(SHARDS)
+        ]
+        self.__address_client_maps: List[Dict[Tuple[str, int], int]] = [
+            dict() for _ in range(SHARDS)
+        ]
+        self.__session_counters: List[Optional[itertools.count]] = [None] * 0x10000
 
     @property
-    def lock(self) -> threading.RLock:
-        """Returns the internal lock object for ensuring thread safety."""
-        return self.__lock
+    def locks(self) -> Tuple[threading.Lock, ...]:
+        """Returns the per-shard lock objects for ensuring thread safety."""
+        return self.__locks
 
     @property
-    def client_pool(self) -> set:
-        """Returns the current pool of available client IDs."""
-        return self.__client_pool
+    def free_bits(self) -> List[int]:
+        """Returns the per-shard bitmaps of available client IDs."""
+        return self.__free_bits
 
     @property
-    def address_client_map(self) -> Dict[Tuple[str, int], int]:
-        """Returns the mapping of (IP, port) to client IDs."""
-        return self.__address_client_map
+    def address_client_maps(self) -> List[Dict[Tuple[str, int], int]]:
+        """Returns the per-shard mappings of (IP, port) to client IDs."""
+        return self.__address_client_maps
 
     @property
-    def client_session_map(self) -> Dict[int, itertools.count]:
-        """Returns the mapping of client IDs to session ID counters."""
-        return self.__client_session_map
+    def session_counters(self) -> List[Optional[itertools.count]]:
+        """Returns the table of session ID counters indexed by client ID."""
+        return self.__session_counters
+
+    @staticmethod
+    def initial_free_bits(shard: int) -> int:
+        """
+        Builds the bitmap with every client ID owned by a shard marked free.
+
+        Args:
+            shard (int): The shard index.
+
+        Returns:
+            int: A bitmap covering every client ID in 1..0xFFFE with
+            ``client_id % SHARDS == shard``.
+        """
+        bits = (1 << ((0xFFFE - shard) // SHARDS + 1)) - 1
+        # Client ID 0 is reserved and maps to bit 0 of shard 0.
+        return bits & ~1 if shard == 0 else bits
+
+    def take_client_id(self, shard: int) -> int:
+        """
+        Takes the lowest free client ID from a shard. The caller must hold the shard lock.
+
+        Args:
+            shard (int): The shard index.
+
+        Returns:
+            int: The allocated client ID.
+
+        Raises:
+            KeyError: If the shard has no free client ID left.
+        """
+        bits = self.free_bits[shard]
+        if not bits:
+            raise KeyError("No client ID available")
+        lowest = bits & -bits
+        self.free_bits[shard] = bits ^ lowest
+        return (lowest.bit_length() - 1) * SHARDS + shard
+
+    def borrow_client_id(self, shard: int) -> int:
+        """
+        Takes a free client ID from any shard other than ``shard``. The caller
+        must not hold a shard lock.
+
+        Each shard is locked on its own in turn, so no two shard locks are ever
+        held at once.
+
+        Args:
+            shard (int): The index of the exhausted shard.
+
+        Returns:
+            int: The allocated client ID.
+
+        Raises:
+            KeyError: If no shard has a free client ID left.
+        """
+        for offset in range(1, SHARDS):
+            other = (shard + offset) % SHARDS
+            with self.__locks[other]:
+                if self.__free_bits[other]:
+                    return self.take_client_id(other)
+        raise KeyError("No client ID available")
 
     def get_client_id(self, local: Tuple[str, int]) -> int:
         """
@@ -61,29 +143,126 @@ class Allocator:
 
         Returns:
             int: The assigned client ID.
+
+        Raises:
+            KeyError: If every client ID is taken.
+        """
+        shard = hash(local) % SHARDS
+        address_client_map = self.__address_client_maps[shard]
+        # Dict reads are atomic under the GIL; only an unassigned address needs the lock.
+        client_id = address_client_map.get(local)
+        if client_id is not None:
+            return client_id
+        with self.locks[shard]:
+            # Re-read the map: ``release`` may have swapped it in the meantime.
+            address_client_map = self.__address_client_maps[shard]
+            client_id = address_client_map.get(local)
+            if client_id is not None:
+                return client_id
+            if self.free_bits[shard]:
+                client_id = self.take_client_id(shard)
+                self.session_counters[client_id] = itertools.count()
+                address_client_map[local] = client_id
+                return client_id
+        # This shard is exhausted: borrow from the others without holding its lock.
+        client_id = self.borrow_client_id(shard)
+        with self.locks[shard]:
+            address_client_map = self.__address_client_maps[shard]
+            existing = address_client_map.get(local)
+            if existing is None:
+                self.session_counters[client_id] = itertools.count()
+                address_client_map[local] = client_id
+                return client_id
+        # Another caller assigned this address meanwhile; give the ID back.
+        owner = client_id % SHARDS
+        with self.locks[owner]:
+            self.free_bits[owner] |= 1 << (client_id // SHARDS)
+        return existing
+
+    def session_counter(self, client_id: int) -> itertools.count:
+        """
+        Returns the session ID counter of a client ID, creating it if needed.
+
+        Counters are normally created by ``get_client_id``; creation for a client
+        ID obtained elsewhere happens under the owning shard lock so that racing
+        callers share a single counter.
+
+        Args:
+            client_id (int): The client ID (0 to 0xFFFF).
+
+        Returns:
+            itertools.count: The session ID counter.
+
+        Raises:
+            ValueError: If the client ID is out of range.
         """
-        with self.lock:
-            if local not in self.address_client_map:
-                self.address_client_map[local] = self.client_pool.pop()
-            return self.address_client_map[local]
+        # A negative index would silently address the table from its end.
+        if client_id & ~0xFFFF:
+            raise ValueError("Invalid client ID")
+        session_iter = self.session_counters[client_id]
+        if session_iter is None:
+            with self.locks[client_id % SHARDS]:
+                session_iter = self.session_counters[client_id]
+                if session_iter is None:
+                    session_iter = itertools.count()
+                    self.session_counters[client_id] = session_iter
+        return session_iter
 
     def get_session_id(self, client_id: int) -> int:
         """
-        Retrieves the next session ID for a given client ID. Resets if the limit is reached.
+        Retrieves the next session ID for a given client ID. Wraps around to 1
+        after 0xFFFE.
+
+        The counter is advanced without taking the lock: ``itertools.count``
+        increments in C under the GIL, so concurrent callers never observe the
+        same value. Counters live in a preallocated table indexed by client ID,
+        so the hot path is one list index and one ``next``.
 
         Args:
             client_id (int): The client ID for which to get a session ID.
 
         Returns:
             int: The assigned session ID.
+
+        Raises:
+            ValueError: If the client ID is out of range.
         """
-        with self.lock:
-            session_iter = self.client_session_map[client_id]
-            session_id = next(session_iter)
-            if session_id >= 0xFFFF:
-                self.client_session_map[client_id] = itertools.count(start=1)
-                return next(self.client_session_map[client_id])
-            return session_id
+        if client_id & ~0xFFFF:
+            raise ValueError("Invalid client ID")
+        session_iter = self.__session_counters[client_id]
+        if session_iter is None:
+            session_iter = self.session_counter(client_id)
+        return next(session_iter) % 0xFFFE + 1
+
+    def reserve_session_ids(self, client_id: int, count: int = 64) -> Tuple[range, ...]:
+        """
+        Reserves a block of consecutive session IDs for a given client ID.
+
+        The counter is advanced by ``count`` in a single C-level call (``next``
+        on an ``islice`` that skips to the last reserved value), during which
+        the GIL is not released, so the block cannot interleave with concurrent
+        ``get_session_id`` or ``reserve_session_ids`` calls. No intermediate
+        value is materialized.
+
+        Args:
+            client_id (int): The client ID for which to reserve session IDs.
+            count (int): The number of session IDs to reserve (1 to 0xFFFE).
+
+        Returns:
+            Tuple[range, ...]: The reserved session IDs. A block that wraps past
+            0xFFFE is split into two ranges, the second one restarting at 1.
+
+        Raises:
+            ValueError: If ``count`` is out of range.
+        """
+        if not 0 < count <= 0xFFFE:
+            raise ValueError("Invalid session ID count")
+        session_iter = self.session_counter(client_id)
+        last = next(itertools.islice(session_iter, count - 1, None))
+        first = (last - count + 1) % 0xFFFE + 1
+        if first + count <= 0xFFFF:
+            return (range(first, first + count),)
+        return (range(first, 0xFFFF), range(1, first + count - 0xFFFE))
 
     def release_client_id(self, local: Tuple[str, int]):
         """
@@ -92,17 +271,39 @@ class Allocator:
         Args:
             local (Tuple[str, int]): The (IP, port) pair.
         """
-        with self.lock:
-            if local in self.address_client_map:
-                client_id = self.address_client_map.pop(local)
-                self.client_session_map.pop(client_id, None)
-                self.client_pool.add(client_id)
+        shard = hash(local) % SHARDS
+        address_client_map = self.__address_client_maps[shard]
+        # Releasing an unknown address is the common idempotent-cleanup case; a
+        # stale positive only means the check is repeated under the lock.
+        if local not in address_client_map:
+            return
+        with self.__locks[shard]:
+            client_id = self.__address_client_maps[shard].pop(local, None)
+            if client_id is None:
+                return
+            # Drop the counter before the ID can be handed out again.
+            self.__session_counters[client_id] = None
+            owner = client_id % SHARDS
+            if owner == shard:
+                self.__free_bits[shard] |= 1 << (client_id // SHARDS)
+                return
+        # A borrowed ID goes back to the shard that owns it, under that lock only.
+        with self.__locks[owner]:
+            self.__free_bits[owner] |= 1 << (client_id // SHARDS)
 
     def release(self):
         """
         Releases all allocated client IDs and session IDs, resetting all resources.
+
+        Each shard swaps in a fresh map and bitmap under its lock, so the time a
+        shard lock is held does not depend on how many addresses are mapped; the
+        old maps are dropped after all locks are released.
         """
-        with self.lock:
-            self.client_session_map.clear()
-            self.address_client_map.clear()
-            self.client_pool.update(set(range(1, 0xFFFF)))
+        released = list()
+        for shard in range(SHARDS):
+            with self.__locks[shard]:
+                released.append(self.__address_client_maps[shard])
+                self.__address_client_maps[shard] = dict()
+                self.__free_bits[shard] = self.initial_free_bits(shard)
+        self.__session_counters = [None] * 0x10000
+        del released
@@ -1,27 +1,66 @@
 __all__ = ["Constructor"]
 
 
+import functools
 import os
+import threading
 from logging import FileHandler, Formatter, Logger, StreamHandler
 from pathlib import Path
-
-import toml
+from typing import Dict, Tuple
 
 from core.allocator import Allocator
 from core.environment import Environment
 from core.part import Part
 from core.transceiver import Transceiver
 from tester.base import Base as TesterBase
+from utils import load_toml
+
+_FILE_HANDLERS: Dict[Tuple[Path, int, Formatter], FileHandler] = dict()
+_FILE_HANDLERS_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _formatter(log_format: str) -> Formatter:
+    """Returns the shared Formatter for a format string."""
+    return Formatter(log_format)
+
+
+def _file_handler(log_path: Path, log_level: int, log_format: Formatter) -> FileHandler:
+    """Returns the shared FileHandler for a log file, level and formatter, opening it once.
+
+    Formatters come from ``_formatter``, so one format string always maps to the
+    same key.
+    """
+    key = (log_path, log_level, log_format)
+    with _FILE_HANDLERS_LOCK:
+        file_handler = _FILE_HANDLERS.get(key)
+        if file_handler is None:
+            file_handler = FileHandler(log_path, mode="a", encoding="utf-8")
+            file_handler.setLevel(log_level)
+            file_handler.setFormatter(log_format)
+            _FILE_HANDLERS[key] = file_handler
+        return file_handler
 
 
 class Constructor:
+    """
+    Builds and holds the components required to run a tester.
+
+    Components are built lazily: each property runs its ``build_*`` method on
+    first access, so callers only pay for the components they actually use.
+    First access is guarded by a re-entrant lock (building one component may
+    access others) with double-checked locking, so concurrent callers build
+    each component once.
+    """
+
     def __init__(self):
-        self.build_environment()
-        self.build_part()
-        self.build_allocator()
-        self.build_transceiver()
-        self.build_logger()
-        self.build_tester()
+        self.__lock = threading.RLock()
+        self.__environment = None
+        self.__part = None
+        self.__allocator = None
+        self.__transceiver = None
+        self.__logger = None
+        self.__tester = None
 
     @property
     def environment(self) -> Environment:
@@ -30,6 +69,10 @@ class Constructor:
         Returns:
             Environment: The environment configuration instance.
         """
+        if self.__environment is None:
+            with self.__lock:
+                if self.__environment is None:
+                    self.build_environment()
         return self.__environment
 
     @property
@@ -39,6 +82,10 @@ class Constructor:
         Returns:
             Part: The part configuration instance.
         """
+        if self.__part is None:
+            with self.__lock:
+                if self.__part is None:
+                    self.build_part()
         return self.__part
 
     @property
@@ -48,6 +95,10 @@ class Constructor:
         Returns:
             Allocator: The allocator instance for managing client-session allocation.
         """
+        if self.__allocator is None:
+            with self.__lock:
+                if self.__allocator is None:
+                    self.build_allocator()
         return self.__allocator
 
     @property
@@ -57,6 +108,10 @@ class Constructor:
         Returns:
             Transceiver: The transceiver instance for network communication.
         """
+        if self.__transceiver is None:
+            with self.__lock:
+                if self.__transceiver is None:
+                    self.build_transceiver()
         return self.__transceiver
 
     @property
@@ -66,6 +121,10 @@ class Constructor:
         Returns:
             Logger: The logger instance for handling log messages.
         """
+        if self.__logger is None:
+            with self.__lock:
+                if self.__logger is None:
+                    self.build_logger()
         return self.__logger
 
     @property
@@ -75,16 +134,20 @@ class Constructor:
         Returns:
             TesterBase: The selected tester instance based on the vehicle type.
         """
+        if self.__tester is None:
+            with self.__lock:
+                if self.__tester is None:
+                    self.build_tester()
         return self.__tester
 
     def build_environment(self) -> None:
         """Builds and initializes the environment configuration."""
-        self.__environment = Environment(
+        self.__environment = Environment.get(
             config_path=Path(os.getenv("CONFIG_PATH")),
             log_name=os.getenv("LOG_NAME"),
             log_path=Path(os.getenv("LOG_PATH")),
             log_level=int(os.getenv("LOG_LEVEL")),
-            log_format=Formatter(os.getenv("LOG_FORMAT")),
+            log_format=_formatter(os.getenv("LOG_FORMAT")),
             vehicle_type=os.getenv("VEHICLE_TYPE"),
         )
 
@@ -92,10 +155,11 @@ class Constructor:
         """Builds and initializes the part configuration.
 
         Loads configuration data from TOML files for MDC, TBOX, and VDC.
+        Parsed files are cached, so rebuilding only re-reads changed files.
         """
-        load_mdc = toml.load(self.environment.config_path / "mdc.toml")
-        load_tbox = toml.load(self.environment.config_path / "tbox.toml")
-        load_vdc = toml.load(self.environment.config_path / "vdc.toml")
+        load_mdc = load_toml(self.environment.config_path / "mdc.toml")
+        load_tbox = load_toml(self.environment.config_path / "tbox.toml")
+        load_vdc = load_toml(self.environment.config_path / "vdc.toml")
         mdc = tuple(load_mdc.get("address").values())
         tbox = tuple(load_tbox.get("address").values())
         vdc = tuple(load_vdc.get("address").values())
@@ -107,18 +171,21 @@ class Constructor:
 
     def build_transceiver(self) -> None:
         """Builds and initializes the transceiver."""
-        self.__transceiver = Transceiver()
+        self.__transceiver = Transceiver(logger=self.logger)
 
     def build_logger(self) -> None:
         """Builds and initializes the logger.
 
         Configures both a file handler and a stream handler for logging.
+        The file handler is shared by every logger writing to the same file at
+        the same level with the same format, so rebuilding does not reopen the
+        log file.
         """
-        file_handler = FileHandler(
-            self.environment.log_path, mode="a", encoding="utf-8"
+        file_handler = _file_handler(
+            self.environment.log_path,
+            self.environment.log_level,
+            self.environment.log_format,
         )
-        file_handler.setLevel(self.environment.log_level)
-        file_handler.setFormatter(self.environment.log_format)
 
         stream_handler = StreamHandler()
         stream_handler.setLevel(self.environment.log_level)
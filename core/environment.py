@@ -1,75 +1,59 @@
 __all__ = ["Environment"]
 
 
+import threading
 from pathlib import Path
 from logging import Formatter
+from typing import NamedTuple
 
+_INSTANCE_LOCK = threading.Lock()
 
-from utils import singleton
 
-
-@singleton
-class Environment:
+class Environment(NamedTuple):
     """
-    A singleton class that holds environment configurations.
+    A class that holds environment configurations.
 
     This class provides configuration settings related to logging and application paths.
-    It ensures that only a single instance is created throughout the application lifecycle.
+    Calling ``Environment(...)`` builds a new instance every time; callers that need
+    the shared instance must use ``Environment.get``, which creates it on the first
+    call and returns the instance cached on the class afterwards.
+    Being a named tuple, it is immutable and attribute access is a plain tuple slot read.
+
+    Attributes:
+        config_path (Path): The path to the configuration file.
+        log_name (str): The name of the log file.
+        log_path (Path): The directory where logs are stored.
+        log_level (int): The logging level.
+        log_format (Formatter): The logging format.
+        vehicle_type (str): The vehicle type.
     """
 
-    def __init__(
-        self,
-        config_path: Path,
-        log_name: str,
-        log_path: Path,
-        log_level: int,
-        log_format: Formatter,
-        vehicle_type: str,
-    ) -> None:
-        """
-        Initializes the environment settings.
-
-        Args:
-            config_path (Path): The path to the configuration file.
-            log_name (str): The name of the log file.
-            log_path (Path): The directory where logs are stored.
-            log_level (int): The logging level.
-            log_format (Formatter): The logging format.
-            vehicle_type (str): The vehicle type.
-        """
-        self.__config_path = config_path
-        self.__log_name = log_name
-        self.__log_path = log_path
-        self.__log_level = log_level
-        self.__log_format = log_format
-        self.__vehicle_type = vehicle_type
-
-    @property
-    def config_path(self) -> Path:
-        """Gets the configuration file path."""
-        return self.__config_path
-
-    @property
-    def log_name(self) -> str:
-        """Gets the log file name."""
-        return self.__log_name
+    config_path: Path
+    log_name: str
+    log_path: Path
+    log_level: int
+    log_format: Formatter
+    vehicle_type: str
 
-    @property
-    def log_path(self) -> Path:
-        """Gets the log storage directory."""
-        return self.__log_path
+    _instance = None
 
-    @property
-    def log_level(self) -> int:
-        """Gets the logging level."""
-        return self.__log_level
+    @classmethod
+    def get(cls, **kwargs) -> "Environment":
+        """
+        Returns the shared environment, creating it on the first call.
 
-    @property
-    def log_format(self) -> Formatter:
-        """Gets the logging format."""
-        return self.__log_format
+        Args:
+            **kwargs: Field values used to create the instance on the first call.
+                They are ignored once the instance exists.
 
-    @property
-    def vehicle_type(self) -> str:
-        """Gets the vehicle type."""
-        return self.__vehicle_type
+        Returns:
+            Environment: The shared environment instance.
+        """
+        instance = cls._instance
+        if instance is None:
+            with _INSTANCE_LOCK:
+                instance = cls._instance
+                if instance is None:
+                    instance = cls(**kwargs)
+                    cls._instance = instance
+        return instance
@@ -1,26 +1,288 @@
 __all__ = ["Transceiver"]
 
 
+import selectors
 import socket
-from typing import Tuple
+import struct
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError
+from logging import Logger, getLogger
+from typing import Deque, Dict, Optional, Tuple
+
+# Linux only; the socket module exposes it from Python 3.12.
+IP_BIND_ADDRESS_NO_PORT = getattr(socket, "IP_BIND_ADDRESS_NO_PORT", 24)
+RECEIVE_BUFFER_SIZE = 0x10000
+# struct linger {l_onoff = 1, l_linger = 0}: close resets the connection instead of
+# leaving the fixed local address in TIME_WAIT.
+LINGER = struct.pack("ii", 1, 0)
+# Largest SOME/IP message accepted on a stream, header included. The length field
+# comes from the peer, so it must not decide alone how far a buffer may grow.
+MAXIMUM_MESSAGE_SIZE = 0x100000
 
 
 class Transceiver:
     """
-    A network transceiver for sending and receiving data over TCP.
+    A network transceiver for sending and receiving data over TCP and UDP.
+
+    This class provides methods to exchange a data packet and its response
+    between a local and remote address, over a TCP connection or as datagrams.
+
+    Connected sockets are kept alive in a pool keyed by (local, remote) and
+    reused by later calls, so sequential requests between the same endpoints
+    skip the bind, connect and handshake. Datagram sockets are created once per
+    (local, remote) pair and kept open. Call ``close_all`` on shutdown.
 
-    This class provides a method to establish a TCP connection between a local
-    and remote address, send a data packet, and receive a response.
+    ``submit`` pipelines requests: many requests may be outstanding on one
+    connection per (local, remote) pair, and a single dispatcher thread waits on
+    all of them with a selector and resolves each caller's future by matching the
+    response's request ID (service, method, client and session ID).
     """
 
-    def send(
+    def __init__(self, logger: Optional[Logger] = None):
+        """
+        Initializes the Transceiver.
+
+        Args:
+            logger (Optional[Logger]): The logger for events on the dispatcher
+                thread. Defaults to the module logger.
+
+        - Maintains a lock guarding the socket pool.
+        - Stores idle connected sockets per (local, remote) pair.
+        - Stores one datagram socket and its exchange lock per (local, remote) pair.
+        - Stores one pipelined connection and its send lock per (local, remote) pair.
+        - Stores the futures of outstanding pipelined requests by request ID.
+        - Starts the selector and dispatcher thread lazily, on the first ``submit``.
+        - Keeps a receive buffer per thread in thread-local storage.
+        """
+        self.__lock = threading.Lock()
+        self.__pool: Dict[
+            Tuple[Tuple[str, int], Tuple[str, int]], Deque[socket.socket]
+        ] = dict()
+        self.__datagram_sockets: Dict[
+            Tuple[Tuple[str, int], Tuple[str, int]],
+            Tuple[socket.socket, threading.Lock],
+        ] = dict()
+        self.__channels: Dict[
+            Tuple[Tuple[str, int], Tuple[str, int]],
+            Tuple[socket.socket, threading.Lock],
+        ] = dict()
+        self.__pending: Dict[Tuple[Tuple[str, int], Tuple[str, int], bytes], Future] = (
+            dict()
+        )
+        self.__selector: Optional[selectors.BaseSelector] = None
+        self.__wakeup: Optional[socket.socket] = None
+        self.__local = threading.local()
+        self.__logger = logger if logger is not None else getLogger(__name__)
+
+    @property
+    def logger(self) -> Logger:
+        """Returns the logger for events on the dispatcher thread."""
+        return self.__logger
+
+    @property
+    def lock(self) -> threading.Lock:
+        """Returns the lock object guarding the socket pool."""
+        return self.__lock
+
+    @property
+    def pool(
+        self,
+    ) -> Dict[Tuple[Tuple[str, int], Tuple[str, int]], Deque[socket.socket]]:
+        """Returns the idle connected sockets per (local, remote) pair."""
+        return self.__pool
+
+    @property
+    def datagram_sockets(
+        self,
+    ) -> Dict[
+        Tuple[Tuple[str, int], Tuple[str, int]], Tuple[socket.socket, threading.Lock]
+    ]:
+        """Returns the datagram socket and exchange lock per (local, remote) pair."""
+        return self.__datagram_sockets
+
+    @property
+    def channels(
+        self,
+    ) -> Dict[
+        Tuple[Tuple[str, int], Tuple[str, int]], Tuple[socket.socket, threading.Lock]
+    ]:
+        """Returns the pipelined connection and send lock per (local, remote) pair."""
+        return self.__channels
+
+    @property
+    def pending(
+        self,
+    ) -> Dict[Tuple[Tuple[str, int], Tuple[str, int], bytes], Future]:
+        """Returns the outstanding pipelined requests by (local, remote, request ID)."""
+        return self.__pending
+
+    @property
+    def receive_buffer(self) -> bytearray:
+        """Returns the calling thread's receive buffer, allocating it on first use."""
+        try:
+            return self.__local.receive_buffer
+        except AttributeError:
+            self.__local.receive_buffer = bytearray(RECEIVE_BUFFER_SIZE)
+            return self.__local.receive_buffer
+
+    @staticmethod
+    def reuse_address(s: socket.socket):
+        """
+        Lets a socket bind to a local address that is still held by an earlier socket.
+
+        Sets ``SO_REUSEADDR``, and ``SO_REUSEPORT`` where the platform has it.
+
+        Args:
+            s (socket.socket): The socket, before it is bound.
+        """
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+    def connect(self, local: Tuple[str, int], remote: Tuple[str, int]) -> socket.socket:
+        """
+        Creates a TCP socket bound to a local address and connected to a remote address.
+
+        The local address may be rebound while an earlier connection from it is
+        in TIME_WAIT. On Linux, binding to port 0 defers port selection to
+        ``connect``, so the ephemeral port only has to be unique per remote.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port) to bind the socket.
+            remote (Tuple[str, int]): The remote address (IP, port) to connect to.
+
+        Returns:
+            socket.socket: The connected socket.
+
+        Raises:
+            socket.error: If a socket operation fails.
+        """
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Requests are small and answered before the next one is sent, the
+            # worst case for Nagle's algorithm combined with delayed ACKs.
+            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.reuse_address(s)
+            if sys.platform.startswith("linux"):
+                s.setsockopt(socket.IPPROTO_IP, IP_BIND_ADDRESS_NO_PORT, 1)
+            s.bind(local)
+            s.connect(remote)
+        except OSError:
+            s.close()
+            raise
+        return s
+
+    def acquire(
+        self, local: Tuple[str, int], remote: Tuple[str, int]
+    ) -> Tuple[socket.socket, bool]:
+        """
+        Takes an idle socket for (local, remote) from the pool or connects a new one.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port).
+            remote (Tuple[str, int]): The remote address (IP, port).
+
+        Returns:
+            Tuple[socket.socket, bool]: The socket and whether it was reused from the pool.
+        """
+        with self.lock:
+            idle = self.pool.get((local, remote))
+            if idle:
+                return idle.pop(), True
+        return self.connect(local, remote), False
+
+    def release(
+        self, local: Tuple[str, int], remote: Tuple[str, int], s: socket.socket
+    ):
+        """
+        Returns a socket to the pool so later calls can reuse it.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port).
+            remote (Tuple[str, int]): The remote address (IP, port).
+            s (socket.socket): The connected socket.
+        """
+        with self.lock:
+            self.pool.setdefault((local, remote), deque()).append(s)
+
+    def datagram_socket(
+        self, local: Tuple[str, int], remote: Tuple[str, int]
+    ) -> Tuple[socket.socket, threading.Lock]:
+        """
+        Returns the datagram socket for (local, remote), creating it on first use.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port) to bind the socket.
+            remote (Tuple[str, int]): The remote address (IP, port) to connect to.
+
+        Returns:
+            Tuple[socket.socket, threading.Lock]: The connected datagram socket and
+            the lock serializing exchanges over it.
+
+        Raises:
+            socket.error: If a socket operation fails.
+        """
+        # Dict reads are atomic under the GIL; only a missing socket needs the lock.
+        entry = self.__datagram_sockets.get((local, remote))
+        if entry is not None:
+            return entry
+        with self.lock:
+            entry = self.datagram_sockets.get((local, remote))
+            if entry is None:
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                try:
+                    self.reuse_address(s)
+                    s.bind(local)
+                    s.connect(remote)
+                except OSError:
+                    s.close()
+                    raise
+                entry = (s, threading.Lock())
+                self.datagram_sockets[(local, remote)] = entry
+            return entry
+
+    def close_all(self):
+        """
+        Closes every pooled, datagram and pipelined socket and empties the caches.
+
+        Outstanding pipelined requests fail with ``ConnectionAbortedError``.
+        """
+        with self.lock:
+            pool = list(self.pool.values())
+            self.pool.clear()
+            datagram_sockets = list(self.datagram_sockets.values())
+            self.datagram_sockets.clear()
+            channels = list(self.channels.values())
+            self.channels.clear()
+            wakeup, self.__wakeup, self.__selector = self.__wakeup, None, None
+        for idle in pool:
+            for s in idle:
+                s.close()
+        for s, _ in datagram_sockets:
+            s.close()
+        if wakeup is not None:
+            # Closing the write end stops the dispatcher thread.
+            wakeup.close()
+        for s, _ in channels:
+            s.close()
+        self.fail_pending(None, ConnectionAbortedError("Transceiver closed"))
+
+    def send_tcp(
         self, local: Tuple[str, int], remote: Tuple[str, int], packet: bytes
     ) -> bytes:
         """
         Sends a data packet to a remote address and receives a response.
 
-        This method creates a TCP socket, binds it to a local address, connects to the
-        remote address, sends the packet, and waits for a response.
+        This method reuses a pooled connection between the local and remote address,
+        or creates a TCP socket, binds it to the local address and connects to the
+        remote address, then sends the packet and waits for a response. A pooled
+        connection the peer has dropped is replaced by a fresh one and the packet
+        sent again, but only if sending failed or the peer closed the connection
+        before any byte of a response; any other failure is raised.
 
         Args:
             local (Tuple[str, int]): The local address (IP, port) to bind the socket.
@@ -33,10 +295,390 @@ class Transceiver:
         Raises:
             socket.error: If a socket operation fails.
         """
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, 1)
-            s.bind(local)
-            s.connect(remote)
-            s.sendall(packet)
-            response = s.recv(2048)
+        while True:
+            s, reused = self.acquire(local, remote)
+            try:
+                s.sendall(packet)
+            except (ConnectionResetError, BrokenPipeError):
+                s.close()
+                if not reused:
+                    raise
+                continue
+            except BaseException:
+                s.close()
+                raise
+            try:
+                response = self.receive(s)
+            except BaseException:
+                # The peer may already be handling the packet; sending it again
+                # could run the request twice.
+                s.close()
+                raise
+            # An empty read on a reused socket means the peer closed it while idle,
+            # before sending any byte of a response.
+            if response or not reused:
+                break
+            s.close()
+        self.release(local, remote, s)
         return response
+
+    def receive(self, s: socket.socket) -> bytes:
+        """
+        Receives one SOME/IP message from a stream socket.
+
+        The header is read first and the SOME/IP length field decides how many
+        more bytes to read, so a message is neither truncated nor merged with the
+        next one. Data is received into the calling thread's buffer, which grows
+        if a message does not fit.
+
+        Args:
+            s (socket.socket): The connected stream socket.
+
+        Returns:
+            bytes: The received message, or empty bytes if the peer closed the
+            connection before sending anything.
+
+        Raises:
+            ConnectionResetError: If the peer closes the connection mid-message.
+            ValueError: If the length field exceeds ``MAXIMUM_MESSAGE_SIZE``.
+            socket.error: If a socket operation fails.
+        """
+        buffer = self.receive_buffer
+        view = memoryview(buffer)
+        received = 0
+        # The length field ends at byte 8 and counts the bytes that follow it.
+        size = 8
+        while received < size:
+            n = s.recv_into(view[received:size])
+            if not n:
+                if not received:
+                    return b""
+                raise ConnectionResetError("Connection closed mid-message")
+            received += n
+            if received == 8:
+                size = int.from_bytes(view[4:8], "big") + 8
+                if size > MAXIMUM_MESSAGE_SIZE:
+                    view.release()
+                    raise ValueError("SOME/IP message too large")
+                if size > len(buffer):
+                    view.release()
+                    buffer.extend(bytes(size - len(buffer)))
+                    view = memoryview(buffer)
+        response = bytes(view[:size])
+        view.release()
+        return response
+
+    # Kept for callers written before the UDP path existed.
+    send = send_tcp
+
+    def send_udp(
+        self, local: Tuple[str, int], remote: Tuple[str, int], packet: bytes
+    ) -> bytes:
+        """
+        Sends a datagram to a remote address and receives a response.
+
+        The datagram socket for the local and remote address is reused across
+        calls. Exchanges over the same socket are serialized so that each caller
+        receives the response to its own packet.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port) to bind the socket.
+            remote (Tuple[str, int]): The remote address (IP, port) to send to.
+            packet (bytes): The data packet to be sent.
+
+        Returns:
+            bytes: The response received from the remote address.
+
+        Raises:
+            socket.error: If a socket operation fails.
+        """
+        s, lock = self.datagram_socket(local, remote)
+        buffer = self.receive_buffer
+        with lock:
+            s.send(packet)
+            size = s.recv_into(buffer)
+        with memoryview(buffer) as view:
+            return bytes(view[:size])
+
+    @staticmethod
+    def request_id(packet: bytes) -> bytes:
+        """
+        Extracts the request ID of a SOME/IP message.
+
+        Args:
+            packet (bytes): The encoded SOME/IP message.
+
+        Returns:
+            bytes: The service, method, client and session ID fields, which a
+            response repeats from its request.
+        """
+        return bytes(packet[0:4]) + bytes(packet[8:12])
+
+    def channel(
+        self, local: Tuple[str, int], remote: Tuple[str, int]
+    ) -> Tuple[socket.socket, threading.Lock]:
+        """
+        Returns the pipelined connection for (local, remote), connecting on first use.
+
+        A new connection is registered with the dispatcher's selector, which is
+        started first if needed. Connecting happens outside the lock, so a slow
+        peer does not block other callers; if two callers race, the connection
+        registered first wins and the other one is closed.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port) to bind the socket.
+            remote (Tuple[str, int]): The remote address (IP, port) to connect to.
+
+        Returns:
+            Tuple[socket.socket, threading.Lock]: The connected socket and the
+            lock serializing writes to it.
+
+        Raises:
+            socket.error: If a socket operation fails.
+        """
+        # Dict reads are atomic under the GIL; only a missing connection needs the lock.
+        entry = self.__channels.get((local, remote))
+        if entry is not None:
+            return entry
+        s = self.connect(local, remote)
+        with self.lock:
+            entry = self.channels.get((local, remote))
+            if entry is None:
+                if self.__selector is None:
+                    self.start_dispatcher()
+                entry = (s, threading.Lock())
+                self.channels[(local, remote)] = entry
+                self.__selector.register(
+                    s, selectors.EVENT_READ, (local, remote, bytearray())
+                )
+                # Selectors other than epoll only see the new socket on the next wait.
+                self.__wakeup.send(b"\0")
+                s = None
+        if s is not None:
+            s.close()
+        return entry
+
+    def start_dispatcher(self):
+        """
+        Starts the selector and dispatcher thread. The caller must hold the lock.
+        """
+        selector = selectors.DefaultSelector()
+        wakeup, self.__wakeup = socket.socketpair()
+        selector.register(wakeup, selectors.EVENT_READ, None)
+        self.__selector = selector
+        threading.Thread(
+            target=self.dispatch, args=(selector,), name="transceiver", daemon=True
+        ).start()
+
+    def dispatch(self, selector: selectors.BaseSelector):
+        """
+        Reads responses from every pipelined connection and resolves their futures.
+
+        Runs on the dispatcher thread until ``close_all`` closes the wakeup socket.
+        Responses are framed by the SOME/IP length field, so several responses
+        in one read, or one response split over several reads, are handled.
+
+        Args:
+            selector (selectors.BaseSelector): The selector holding the connections.
+        """
+        try:
+            while True:
+                for key, _ in selector.select():
+                    if key.data is None:
+                        if not key.fileobj.recv(64):
+                            return
+                        continue
+                    try:
+                        self.read_channel(selector, key)
+                    except Exception:
+                        # One bad connection must not stop the dispatcher.
+                        self.logger.exception(
+                            "Failed to read pipelined responses: %s -> %s",
+                            key.data[1],
+                            key.data[0],
+                        )
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.data is None:
+                    key.fileobj.close()
+            selector.close()
+
+    def read_channel(
+        self, selector: selectors.BaseSelector, key: selectors.SelectorKey
+    ):
+        """
+        Reads from one pipelined connection and resolves the futures it answers.
+
+        Args:
+            selector (selectors.BaseSelector): The selector holding the connection.
+            key (selectors.SelectorKey): The selector key of the readable connection.
+        """
+        local, remote, buffer = key.data
+        try:
+            data = key.fileobj.recv(65536)
+        except OSError as e:
+            data, error = b"", e
+        else:
+            error = ConnectionResetError("Connection closed by peer")
+        if not data:
+            selector.unregister(key.fileobj)
+            self.close_channel(local, remote, key.fileobj)
+            self.fail_pending((local, remote), error)
+            return
+        buffer += data
+        while len(buffer) >= 8:
+            # The length field counts the bytes that follow it.
+            size = int.from_bytes(buffer[4:8], "big") + 8
+            if size > MAXIMUM_MESSAGE_SIZE:
+                # The stream cannot be resynchronized; drop it.
+                selector.unregister(key.fileobj)
+                self.close_channel(local, remote, key.fileobj)
+                self.fail_pending(
+                    (local, remote), ValueError("SOME/IP message too large")
+                )
+                return
+            if len(buffer) < size:
+                return
+            response = bytes(buffer[:size])
+            del buffer[:size]
+            future = self.pending.pop((local, remote, self.request_id(response)), None)
+            if future is None:
+                self.logger.warning(
+                    "Dropped response without a pending request: "
+                    "%s -> %s, request id %s",
+                    remote,
+                    local,
+                    self.request_id(response).hex(),
+                )
+            # A future the caller cancelled is skipped; once running it cannot be.
+            elif future.set_running_or_notify_cancel():
+                future.set_result(response)
+
+    def close_channel(
+        self, local: Tuple[str, int], remote: Tuple[str, int], s: socket.socket
+    ):
+        """
+        Closes a pipelined connection and forgets it if it is still the current one.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port).
+            remote (Tuple[str, int]): The remote address (IP, port).
+            s (socket.socket): The connection to close.
+        """
+        with self.lock:
+            entry = self.channels.get((local, remote))
+            if entry is not None and entry[0] is s:
+                del self.channels[(local, remote)]
+        s.close()
+
+    def fail_pending(
+        self, route: Optional[Tuple[Tuple[str, int], Tuple[str, int]]], error: Exception
+    ):
+        """
+        Fails outstanding pipelined requests.
+
+        Args:
+            route (Optional[Tuple[Tuple[str, int], Tuple[str, int]]]): The
+                (local, remote) pair whose requests fail, or None for all requests.
+            error (Exception): The exception set on the failed futures.
+        """
+        for key in list(self.pending):
+            if route is None or key[:2] == route:
+                future = self.pending.pop(key, None)
+                if future is not None and future.set_running_or_notify_cancel():
+                    future.set_exception(error)
+
+    def forget(
+        self, key: Tuple[Tuple[str, int], Tuple[str, int], bytes], future: Future
+    ):
+        """
+        Drops a finished request from the outstanding requests.
+
+        Called when the future is done, so a cancelled request frees its request
+        ID; a newer request registered under the same key is left alone.
+
+        Args:
+            key (Tuple[Tuple[str, int], Tuple[str, int], bytes]): The
+                (local, remote, request ID) of the request.
+            future (Future): The request's future.
+        """
+        with self.lock:
+            if self.pending.get(key) is future:
+                del self.pending[key]
+
+    def submit(
+        self, local: Tuple[str, int], remote: Tuple[str, int], packet: bytes
+    ) -> Future:
+        """
+        Sends a SOME/IP request over the pipelined connection without waiting.
+
+        Any number of requests may be outstanding at once. The returned future
+        is resolved by the dispatcher thread with the response carrying the
+        same request ID, or fails if the connection is lost first. A request the
+        peer never answers stays outstanding and keeps its request ID in use
+        until its future is cancelled; ``request`` does that on timeout.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port) to bind the socket.
+            remote (Tuple[str, int]): The remote address (IP, port) to connect to.
+            packet (bytes): The encoded SOME/IP request.
+
+        Returns:
+            Future: A future resolved with the response bytes.
+
+        Raises:
+            ValueError: If a request with the same request ID is already
+                outstanding between the same addresses.
+            socket.error: If a socket operation fails.
+        """
+        s, lock = self.channel(local, remote)
+        key = (local, remote, self.request_id(packet))
+        future = Future()
+        # Register before sending so that a fast response always finds its future.
+        # Replacing an outstanding future would leave its caller waiting forever.
+        with self.lock:
+            if key in self.pending:
+                raise ValueError("Request ID already pending")
+            self.pending[key] = future
+        future.add_done_callback(lambda f: self.forget(key, f))
+        try:
+            with lock:
+                s.sendall(packet)
+        except OSError:
+            future.cancel()
+            raise
+        return future
+
+    def request(
+        self,
+        local: Tuple[str, int],
+        remote: Tuple[str, int],
+        packet: bytes,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """
+        Sends a SOME/IP request over the pipelined connection and waits for its response.
+
+        Args:
+            local (Tuple[str, int]): The local address (IP, port) to bind the socket.
+            remote (Tuple[str, int]): The remote address (IP, port) to connect to.
+            packet (bytes): The encoded SOME/IP request.
+            timeout (Optional[float]): Seconds to wait for the response, or None
+                to wait without limit.
+
+        Returns:
+            bytes: The response bytes.
+
+        Raises:
+            TimeoutError: If no response arrives in time. The request is
+                cancelled, so its request ID can be used again.
+            ValueError: If a request with the same request ID is already
+                outstanding between the same addresses.
+            socket.error: If a socket operation fails.
+        """
+        future = self.submit(local, remote, packet)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
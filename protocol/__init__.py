@@ -6,9 +6,12 @@ __all__ = [
     "EntryLength",
     "EntryType",
     "EntryService",
+    "EntryServiceBatch",
     "EntryEventgroup",
+    "EntryEventgroupBatch",
     "SomeipsdLength",
     "SomeipsdPacket",
+    "SomeipsdPacketView",
     "SomeipPacket",
     "SomeipLength",
     "MessageType",
@@ -18,8 +21,12 @@ __all__ = [
 from protocol.someip.length import Length as SomeipLength
 from protocol.someip.packet import Packet as SomeipPacket
 from protocol.someipsd.entry.eventgroup import Eventgroup as EntryEventgroup
+from protocol.someipsd.entry.eventgroup_batch import (
+    EventgroupBatch as EntryEventgroupBatch,
+)
 from protocol.someipsd.entry.length import Length as EntryLength
 from protocol.someipsd.entry.service import Service as EntryService
+from protocol.someipsd.entry.service_batch import ServiceBatch as EntryServiceBatch
 from protocol.someipsd.entry.type import Type as EntryType
 from protocol.someipsd.length import Length as SomeipsdLength
 from protocol.someipsd.option.ipv4 import IPv4 as OptionIPv4
@@ -27,5 +34,6 @@ from protocol.someipsd.option.ipv6 import IPv6 as OptionIPv6
 from protocol.someipsd.option.length import Length as OptionLength
 from protocol.someipsd.option.type import Type as OptionType
 from protocol.someipsd.packet import Packet as SomeipsdPacket
+from protocol.someipsd.packet_view import PacketView as SomeipsdPacketView
 from protocol.types.message_type import MessageType
 from protocol.types.return_code import ReturnCode
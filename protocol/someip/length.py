@@ -1,11 +1,8 @@
 __all__ = ["Length"]
 
 
-from enum import IntEnum
-
-
-class Length(IntEnum):
-    """Enumeration for fields in a message header, defined by their bit lengths."""
+class Length:
+    """Plain int constants for fields in a message header, defined by their bit lengths."""
 
     SERVICE_ID = 16
     METHOD_ID = 16
@@ -1,11 +1,19 @@
 __all__ = ["Packet"]
 
 
-from bitarray import bitarray
-from bitarray.util import ba2int, int2ba
+import struct
 
-from protocol.someip.length import Length
-from utils.series_reader import SeriesReader
+# Service ID, method ID, length, client ID, session ID, protocol version,
+# interface version, message type and return code, in network byte order.
+_HEADER = struct.Struct(">HHIHHBBBB")
+# Bound once so the hot paths skip the attribute lookups on the Struct.
+_HEADER_SIZE = _HEADER.size
+# Header bytes that precede the end of the length field; the length field counts
+# everything after it, i.e. the rest of the header and the payload.
+_LENGTH_END = 8
+_pack_header = _HEADER.pack
+_pack_header_into = _HEADER.pack_into
+_unpack_header_from = _HEADER.unpack_from
 
 
 class Packet:
@@ -25,6 +33,7 @@ class Packet:
 
     Methods:
         encode(): Encode the packet to bytes.
+        encode_into(buffer, offset) -> int: Encode the packet into a writable buffer.
         decode(series: bytes) -> Packet: Decode the packet from bytes.
     """
 
@@ -38,6 +47,7 @@ class Packet:
         "__message_type",
         "__return_code",
         "__payload",
+        "__encoded",
     )
 
     def __init__(
@@ -75,6 +85,7 @@ class Packet:
         self.__message_type = message_type
         self.__return_code = return_code
         self.__payload = bytes(payload)
+        self.__encoded = None
 
     @property
     def service_id(self) -> int:
@@ -123,49 +134,128 @@ class Packet:
 
     @property
     def length(self) -> int:
-        """Returns the total length of the packet (header + payload)."""
-        return Packet.expected_header_length() // 8 + len(self.payload)
+        """Returns the length field of the packet: the bytes that follow it, i.e.
+        the rest of the header and the payload."""
+        return _HEADER_SIZE - _LENGTH_END + len(self.__payload)
 
     @staticmethod
     def expected_header_length() -> int:
-        """Returns the length of the header."""
-        length = sum(
-            (
-                Length.SERVICE_ID,
-                Length.METHOD_ID,
-                Length.LENGTH,
-                Length.CLIENT_ID,
-                Length.SESSION_ID,
-                Length.PROTOCOL_VERSION,
-                Length.INTERFACE_VERSION,
-                Length.MESSAGE_TYPE,
-                Length.RETURN_CODE,
-            )
-        )
-        return length
+        """Returns the length of the header in bits."""
+        return _HEADER_SIZE * 8
 
     def encode(self) -> bytes:
         """Encodes the packet into a byte sequence.
 
+        The packet is immutable, so the bytes are built on the first call and
+        the same object is returned by later calls.
+
         Returns:
             bytes: The encoded packet.
         """
-        series = bitarray()
-        series += int2ba(self.service_id, length=Length.SERVICE_ID)
-        series += int2ba(self.method_id, length=Length.METHOD_ID)
-        series += int2ba(self.length, length=Length.LENGTH)
-        series += int2ba(self.client_id, length=Length.CLIENT_ID)
-        series += int2ba(self.session_id, length=Length.SESSION_ID)
-        series += int2ba(self.protocol_version, length=Length.PROTOCOL_VERSION)
-        series += int2ba(self.interface_version, length=Length.INTERFACE_VERSION)
-        series += int2ba(self.message_type, length=Length.MESSAGE_TYPE)
-        series += int2ba(self.return_code, length=Length.RETURN_CODE)
-
-        return series.tobytes() + self.payload
+        if self.__encoded is not None:
+            return self.__encoded
+        payload = self.__payload
+        # Read the slots directly rather than through the properties.
+        header = _pack_header(
+            self.__service_id,
+            self.__method_id,
+            _HEADER_SIZE - _LENGTH_END + len(payload),
+            self.__client_id,
+            self.__session_id,
+            self.__protocol_version,
+            self.__interface_version,
+            self.__message_type,
+            self.__return_code,
+        )
+        self.__encoded = header + payload
+        return self.__encoded
+
+    def encode_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """Encodes the packet into a preallocated writable buffer.
+
+        Header and payload are written in place, so batching several packets
+        into one buffer costs no intermediate ``bytes`` objects.
+
+        Args:
+            buffer (bytearray): The buffer to write to, large enough to hold the
+                packet from ``offset`` on.
+            offset (int): The position in the buffer at which to start writing.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            ValueError: If the buffer is too small.
+        """
+        payload = self.__payload
+        size = _HEADER_SIZE + len(payload)
+        if len(buffer) - offset < size:
+            raise ValueError("Buffer too small for SOME/IP packet")
+        _pack_header_into(
+            buffer,
+            offset,
+            self.__service_id,
+            self.__method_id,
+            size - _LENGTH_END,
+            self.__client_id,
+            self.__session_id,
+            self.__protocol_version,
+            self.__interface_version,
+            self.__message_type,
+            self.__return_code,
+        )
+        buffer[offset + _HEADER_SIZE : offset + size] = payload
+        return size
+
+    @classmethod
+    def _trusted_new(
+        cls,
+        service_id: int,
+        method_id: int,
+        client_id: int,
+        session_id: int,
+        protocol_version: int,
+        interface_version: int,
+        message_type: int,
+        return_code: int,
+        payload: bytes,
+    ) -> "Packet":
+        """Creates a packet from fields that are already known to be well-formed.
+
+        Skips ``__init__``, so no keyword binding or payload copy takes place.
+        Only meant for values unpacked from a fixed-width header, which are in
+        range by construction.
+
+        Args:
+            service_id (int): The service ID.
+            method_id (int): The method ID.
+            client_id (int): The client ID.
+            session_id (int): The session ID.
+            protocol_version (int): The protocol version.
+            interface_version (int): The interface version.
+            message_type (int): The message type.
+            return_code (int): The return code.
+            payload (bytes): The payload, which must already be ``bytes``.
+
+        Returns:
+            Packet: The created Packet object.
+        """
+        packet = cls.__new__(cls)
+        packet.__service_id = service_id
+        packet.__method_id = method_id
+        packet.__client_id = client_id
+        packet.__session_id = session_id
+        packet.__protocol_version = protocol_version
+        packet.__interface_version = interface_version
+        packet.__message_type = message_type
+        packet.__return_code = return_code
+        packet.__payload = payload
+        packet.__encoded = None
+        return packet
 
     @classmethod
     def decode(cls, series: bytes) -> "Packet":
-        """Decodes the packet from a byte sequence using bitarray.
+        """Decodes the packet from a byte sequence.
 
         Args:
             series (bytes): The byte sequence representing the packet.
@@ -176,34 +266,31 @@ class Packet:
         Raises:
             ValueError: If the packet header is invalid.
         """
-        bits = bitarray()
-        bits.frombytes(series)
-
-        if len(bits) < cls.expected_header_length():
+        if len(series) < _HEADER_SIZE:
             raise ValueError("Invalid SOME/IP header length")
 
-        reader = SeriesReader(bits)
-        service_id = reader.read(Length.SERVICE_ID)
-        method_id = reader.read(Length.METHOD_ID)
-        _ = reader.read(Length.LENGTH)
-        client_id = reader.read(Length.CLIENT_ID)
-        session_id = reader.read(Length.SESSION_ID)
-        protocol_version = reader.read(Length.PROTOCOL_VERSION)
-        interface_version = reader.read(Length.INTERFACE_VERSION)
-        message_type = reader.read(Length.MESSAGE_TYPE)
-        return_code = reader.read(Length.RETURN_CODE)
-        payload = bits[reader.index :]
-
-        return cls(
-            service_id=ba2int(service_id),
-            method_id=ba2int(method_id),
-            client_id=ba2int(client_id),
-            session_id=ba2int(session_id),
-            protocol_version=ba2int(protocol_version),
-            interface_version=ba2int(interface_version),
-            message_type=ba2int(message_type),
-            return_code=ba2int(return_code),
-            payload=payload.tobytes(),
+        (
+            service_id,
+            method_id,
+            _,
+            client_id,
+            session_id,
+            protocol_version,
+            interface_version,
+            message_type,
+            return_code,
+        ) = _unpack_header_from(series, 0)
+
+        return cls._trusted_new(
+            service_id,
+            method_id,
+            client_id,
+            session_id,
+            protocol_version,
+            interface_version,
+            message_type,
+            return_code,
+            bytes(series[_HEADER_SIZE:]),
         )
 
     def __repr__(self) -> str:
@@ -6,14 +6,21 @@ __all__ = [
     "EntryLength",
     "EntryType",
     "EntryService",
+    "EntryServiceBatch",
     "EntryEventgroup",
+    "EntryEventgroupBatch",
     "SomeipsdLength",
     "SomeipsdPacket",
+    "SomeipsdPacketView",
 ]
 
 from protocol.someipsd.entry.eventgroup import Eventgroup as EntryEventgroup
+from protocol.someipsd.entry.eventgroup_batch import (
+    EventgroupBatch as EntryEventgroupBatch,
+)
 from protocol.someipsd.entry.length import Length as EntryLength
 from protocol.someipsd.entry.service import Service as EntryService
+from protocol.someipsd.entry.service_batch import ServiceBatch as EntryServiceBatch
 from protocol.someipsd.entry.type import Type as EntryType
 from protocol.someipsd.length import Length as SomeipsdLength
 from protocol.someipsd.option.ipv4 import IPv4 as OptionIPv4
@@ -21,3 +28,4 @@ from protocol.someipsd.option.ipv6 import IPv6 as OptionIPv6
 from protocol.someipsd.option.length import Length as OptionLength
 from protocol.someipsd.option.type import Type as OptionType
 from protocol.someipsd.packet import Packet as SomeipsdPacket
+from protocol.someipsd.packet_view import PacketView as SomeipsdPacketView
@@ -1,7 +1,18 @@
-__all__ = ["EntryType", "EntryService", "EntryLength", "EntryEventgroup"]
+__all__ = [
+    "EntryType",
+    "EntryService",
+    "EntryServiceBatch",
+    "EntryLength",
+    "EntryEventgroup",
+    "EntryEventgroupBatch",
+]
 
 
 from protocol.someipsd.entry.eventgroup import Eventgroup as EntryEventgroup
+from protocol.someipsd.entry.eventgroup_batch import (
+    EventgroupBatch as EntryEventgroupBatch,
+)
 from protocol.someipsd.entry.length import Length as EntryLength
 from protocol.someipsd.entry.service import Service as EntryService
+from protocol.someipsd.entry.service_batch import ServiceBatch as EntryServiceBatch
 from protocol.someipsd.entry.type import Type as EntryType
@@ -1,11 +1,54 @@
 __all__ = ["Eventgroup"]
 
 
+import struct
+from typing import List, Optional, Union
+
 from bitarray import bitarray
 from bitarray.util import ba2int, int2ba
 
 from protocol.someipsd.entry.length import Length
-from utils.series_reader import SeriesReader
+
+# The nibble and 12-bit fields share their bytes with a neighbour, so they are
+# packed as: number of options 1 and 2 in one byte, major version and TTL in
+# one word, and reserved, counter and eventgroup ID in one word.
+_ENTRY = struct.Struct(">BBBBHHII")
+# Bound once so encode/decode skip the attribute lookups on the Struct.
+_pack_entry = _ENTRY.pack
+_unpack_entry_from = _ENTRY.unpack_from
+_iter_unpack_entries = _ENTRY.iter_unpack
+
+# Bits outside each field width, so validation is a single AND; a negative
+# value has all of them set.
+_OUTSIDE_U4 = ~0xF
+_OUTSIDE_U8 = ~0xFF
+_OUTSIDE_U12 = ~0xFFF
+_OUTSIDE_U16 = ~0xFFFF
+_OUTSIDE_U24 = ~0xFFFFFF
+
+# The labels are padded once here rather than on every __repr__ call.
+_REPR = "\n".join(
+    f"{label:<32}: {{}}"
+    for label in (
+        "type field",
+        "index first option run",
+        "index second option run",
+        "number of options 1",
+        "number of options 2",
+        "service id",
+        "instance id",
+        "major version",
+        "ttl",
+        "reserved",
+        "counter",
+        "eventgroup id",
+    )
+)
+
+
+def _as_int(value: Union[int, bitarray]) -> int:
+    """Returns a field given as an int or a bitarray as an int."""
+    return value if isinstance(value, int) else ba2int(value)
 
 
 class Eventgroup:
@@ -14,8 +57,7 @@ class Eventgroup:
         "__type_field",
         "__index_first_option_run",
         "__index_second_option_run",
-        "__number_of_options_1",
-        "__number_of_options_2",
+        "__number_of_options",
         "__service_id",
         "__instance_id",
         "__major_version",
@@ -23,28 +65,62 @@ class Eventgroup:
         "__reserved",
         "__counter",
         "__eventgroup_id",
+        "__encoded",
     )
 
+    # Length of an encoded event group entry, in bytes.
+    EXPECTED_BYTES = _ENTRY.size
+
     def __init__(
         self,
         type_field: int,
         index_first_option_run: int,
         index_second_option_run: int,
-        number_of_options_1: bitarray,
-        number_of_options_2: bitarray,
+        number_of_options_1: Union[int, bitarray],
+        number_of_options_2: Union[int, bitarray],
         service_id: int,
         instance_id: int,
         major_version: int,
         ttl: int,
-        reserved: bitarray,
-        counter: bitarray,
+        reserved: Union[int, bitarray],
+        counter: Union[int, bitarray],
         eventgroup_id: int,
     ) -> None:
+        number_of_options_1 = _as_int(number_of_options_1)
+        number_of_options_2 = _as_int(number_of_options_2)
+        reserved = _as_int(reserved)
+        counter = _as_int(counter)
+        if type_field & _OUTSIDE_U8:
+            raise ValueError("Invalid type field")
+        if index_first_option_run & _OUTSIDE_U8:
+            raise ValueError("Invalid index first option run")
+        if index_second_option_run & _OUTSIDE_U8:
+            raise ValueError("Invalid index second option run")
+        if number_of_options_1 & _OUTSIDE_U4:
+            raise ValueError("Invalid number of options 1")
+        if number_of_options_2 & _OUTSIDE_U4:
+            raise ValueError("Invalid number of options 2")
+        if service_id & _OUTSIDE_U16:
+            raise ValueError("Invalid service id")
+        if instance_id & _OUTSIDE_U16:
+            raise ValueError("Invalid instance id")
+        if major_version & _OUTSIDE_U8:
+            raise ValueError("Invalid major version")
+        if ttl & _OUTSIDE_U24:
+            raise ValueError("Invalid ttl")
+        if reserved & _OUTSIDE_U12:
+            raise ValueError("Invalid reserved")
+        if counter & _OUTSIDE_U4:
+            raise ValueError("Invalid counter")
+        if eventgroup_id & _OUTSIDE_U16:
+            raise ValueError("Invalid eventgroup id")
+
         self.__type_field = type_field
         self.__index_first_option_run = index_first_option_run
         self.__index_second_option_run = index_second_option_run
-        self.__number_of_options_1 = number_of_options_1
-        self.__number_of_options_2 = number_of_options_2
+        # Sub-byte fields are stored as ints; their bitarray form is built on access.
+        # Both option counts are kept in the one byte they share on the wire.
+        self.__number_of_options = number_of_options_1 << 4 | number_of_options_2
         self.__service_id = service_id
         self.__instance_id = instance_id
         self.__major_version = major_version
@@ -52,6 +128,7 @@ class Eventgroup:
         self.__reserved = reserved
         self.__counter = counter
         self.__eventgroup_id = eventgroup_id
+        self.__encoded = None
 
     @property
     def type_field(self) -> int:
@@ -87,7 +164,7 @@ class Eventgroup:
         Returns:
             bitarray: The number of options (4 bits).
         """
-        return self.__number_of_options_1
+        return int2ba(self.__number_of_options >> 4, length=Length.NUMBER_OF_OPTIONS_1)
 
     @property
     def number_of_options_2(self) -> bitarray:
@@ -96,7 +173,7 @@ class Eventgroup:
         Returns:
             bitarray: The number of options (4 bits).
         """
-        return self.__number_of_options_2
+        return int2ba(self.__number_of_options & 0xF, length=Length.NUMBER_OF_OPTIONS_2)
 
     @property
     def service_id(self) -> int:
@@ -141,7 +218,7 @@ class Eventgroup:
         Returns:
             bitarray: The reserved bits (12 bits).
         """
-        return self.__reserved
+        return int2ba(self.__reserved, length=Length.RESERVED)
 
     @property
     def counter(self) -> bitarray:
@@ -150,7 +227,7 @@ class Eventgroup:
         Returns:
             bitarray: The counter value (4 bits).
         """
-        return self.__counter
+        return int2ba(self.__counter, length=Length.COUNTER)
 
     @property
     def eventgroup_id(self) -> int:
@@ -161,63 +238,103 @@ class Eventgroup:
         """
         return self.__eventgroup_id
 
-    @staticmethod
-    def expected_packet_length() -> int:
+    @classmethod
+    def _from_trusted(
+        cls,
+        type_field: int,
+        index_first_option_run: int,
+        index_second_option_run: int,
+        number_of_options: int,
+        service_id: int,
+        instance_id: int,
+        major_version: int,
+        ttl: int,
+        reserved: int,
+        counter: int,
+        eventgroup_id: int,
+    ) -> "Eventgroup":
+        """Creates an entry from int fields that are already known to be in range.
+
+        Skips ``__init__``, so no keyword binding, conversion or validation takes
+        place. Only meant for values masked out of a fixed-width entry.
+
+        Args:
+            type_field (int): The type field (8 bits).
+            index_first_option_run (int): The index of the first option run (8 bits).
+            index_second_option_run (int): The index of the second option run (8 bits).
+            number_of_options (int): The number of options of the first option run
+                in the high nibble and of the second one in the low nibble (8 bits).
+            service_id (int): The service ID (16 bits).
+            instance_id (int): The instance ID (16 bits).
+            major_version (int): The major version (8 bits).
+            ttl (int): The TTL value (24 bits).
+            reserved (int): The reserved bits (12 bits).
+            counter (int): The counter value (4 bits).
+            eventgroup_id (int): The event group ID (16 bits).
+
+        Returns:
+            Eventgroup: The created event group entry object.
+        """
+        entry = cls.__new__(cls)
+        entry.__type_field = type_field
+        entry.__index_first_option_run = index_first_option_run
+        entry.__index_second_option_run = index_second_option_run
+        entry.__number_of_options = number_of_options
+        entry.__service_id = service_id
+        entry.__instance_id = instance_id
+        entry.__major_version = major_version
+        entry.__ttl = ttl
+        entry.__reserved = reserved
+        entry.__counter = counter
+        entry.__eventgroup_id = eventgroup_id
+        entry.__encoded = None
+        return entry
+
+    @classmethod
+    def expected_packet_length(cls) -> int:
         """Returns the length of the event group packet.
 
         Returns:
-            int: The length of the event group packet in bytes.
+            int: The length of the event group packet in bits.
         """
-        length = sum(
-            (
-                Length.TYPE_FIELD,
-                Length.INDEX_FIRST_OPTION_RUN,
-                Length.INDEX_SECOND_OPTION_RUN,
-                Length.NUMBER_OF_OPTIONS_1,
-                Length.NUMBER_OF_OPTIONS_2,
-                Length.SERVICE_ID,
-                Length.INSTANCE_ID,
-                Length.MAJOR_VERSION,
-                Length.TTL,
-                Length.RESERVED,
-                Length.COUNTER,
-                Length.EVENTGROUP_ID,
-            )
-        )
-        return length
+        return cls.EXPECTED_BYTES * 8
 
     def encode(self) -> bytes:
         """Encodes the event group entry into bytes.
 
+        The entry is immutable, so the bytes are built on the first call and
+        the same object is returned by later calls.
+
         Returns:
             bytes: The byte representation of the event group entry.
         """
-        series = bitarray()
-        series += int2ba(self.type_field, length=Length.TYPE_FIELD)
-        series += int2ba(
-            self.index_first_option_run, length=Length.INDEX_FIRST_OPTION_RUN
+        if self.__encoded is not None:
+            return self.__encoded
+        # Read the slots directly rather than through the properties.
+        self.__encoded = _pack_entry(
+            self.__type_field,
+            self.__index_first_option_run,
+            self.__index_second_option_run,
+            self.__number_of_options,
+            self.__service_id,
+            self.__instance_id,
+            self.__major_version << 24 | self.__ttl,
+            self.__reserved << 20 | self.__counter << 16 | self.__eventgroup_id,
         )
-        series += int2ba(
-            self.index_second_option_run, length=Length.INDEX_SECOND_OPTION_RUN
-        )
-        series += self.number_of_options_1
-        series += self.number_of_options_2
-        series += int2ba(self.service_id, length=Length.SERVICE_ID)
-        series += int2ba(self.instance_id, length=Length.INSTANCE_ID)
-        series += int2ba(self.major_version, length=Length.MAJOR_VERSION)
-        series += int2ba(self.ttl, length=Length.TTL)
-        series += self.reserved
-        series += self.counter
-        series += int2ba(self.eventgroup_id, length=Length.EVENTGROUP_ID)
-
-        return series.tobytes()
+        return self.__encoded
 
     @classmethod
-    def decode(cls, series: bytes) -> "Eventgroup":
+    def decode(cls, series: bytes, offset: Optional[int] = None) -> "Eventgroup":
         """Decodes a byte series into an Eventgroup object.
 
+        The entry is unpacked in place, so an entry inside a larger buffer (an
+        SD entries array, a ``memoryview``) is decoded without slicing it out.
+
         Args:
-            series (bytes): The byte series representing the event group entry.
+            series (bytes): The byte series holding the event group entry.
+            offset (Optional[int]): The position of the entry in the byte series,
+                which then only needs to hold a whole entry from there on. If
+                omitted, the byte series must be exactly one entry.
 
         Returns:
             Eventgroup: The decoded event group entry object.
@@ -225,60 +342,106 @@ class Eventgroup:
         Raises:
             ValueError: If the byte series has an invalid length.
         """
-        packet = bitarray()
-        packet.frombytes(series)
-
-        if len(packet) != cls.expected_packet_length():
+        if offset is None:
+            if len(series) != cls.EXPECTED_BYTES:
+                raise ValueError("Invalid eventgroup entry length")
+            offset = 0
+        elif offset < 0 or len(series) - offset < cls.EXPECTED_BYTES:
             raise ValueError("Invalid eventgroup entry length")
 
-        reader = SeriesReader(packet)
-        type_field = ba2int(reader.read(Length.TYPE_FIELD))
-        index_first_option_run = ba2int(reader.read(Length.INDEX_FIRST_OPTION_RUN))
-        index_second_option_run = ba2int(reader.read(Length.INDEX_SECOND_OPTION_RUN))
-        number_of_options_1 = reader.read(Length.NUMBER_OF_OPTIONS_1)
-        number_of_options_2 = reader.read(Length.NUMBER_OF_OPTIONS_2)
-        service_id = ba2int(reader.read(Length.SERVICE_ID))
-        instance_id = ba2int(reader.read(Length.INSTANCE_ID))
-        major_version = ba2int(reader.read(Length.MAJOR_VERSION))
-        ttl = ba2int(reader.read(Length.TTL))
-        reserved = reader.read(Length.RESERVED)
-        counter = reader.read(Length.COUNTER)
-        eventgroup_id = ba2int(reader.read(Length.EVENTGROUP_ID))
-
-        return cls(
-            type_field=type_field,
-            index_first_option_run=index_first_option_run,
-            index_second_option_run=index_second_option_run,
-            number_of_options_1=number_of_options_1,
-            number_of_options_2=number_of_options_2,
-            service_id=service_id,
-            instance_id=instance_id,
-            major_version=major_version,
-            ttl=ttl,
-            reserved=reserved,
-            counter=counter,
-            eventgroup_id=eventgroup_id,
+        (
+            type_field,
+            index_first_option_run,
+            index_second_option_run,
+            number_of_options,
+            service_id,
+            instance_id,
+            version_ttl,
+            reserved_counter_eventgroup_id,
+        ) = _unpack_entry_from(series, offset)
+        major_version = version_ttl >> 24
+        ttl = version_ttl & 0xFFFFFF
+        reserved = reserved_counter_eventgroup_id >> 20
+        counter = reserved_counter_eventgroup_id >> 16 & 0xF
+        eventgroup_id = reserved_counter_eventgroup_id & 0xFFFF
+
+        return cls._from_trusted(
+            type_field,
+            index_first_option_run,
+            index_second_option_run,
+            number_of_options,
+            service_id,
+            instance_id,
+            major_version,
+            ttl,
+            reserved,
+            counter,
+            eventgroup_id,
         )
 
+    @classmethod
+    def decode_many(cls, series: bytes) -> List["Eventgroup"]:
+        """Decodes consecutive event group entries from a byte series.
+
+        All entries are unpacked in one C-level pass over the buffer, so the
+        per-entry Python work is limited to splitting the shared cells and
+        creating the object without validation.
+
+        Args:
+            series (bytes): The byte series holding the event group entries.
+
+        Returns:
+            List[Eventgroup]: The decoded event group entry objects, in order.
+
+        Raises:
+            ValueError: If the byte series is not a whole number of entries.
+        """
+        if len(series) % cls.EXPECTED_BYTES:
+            raise ValueError("Invalid eventgroup entries length")
+
+        return [
+            cls._from_trusted(
+                type_field,
+                index_first_option_run,
+                index_second_option_run,
+                number_of_options,
+                service_id,
+                instance_id,
+                version_ttl >> 24,
+                version_ttl & 0xFFFFFF,
+                reserved_counter_eventgroup_id >> 20,
+                reserved_counter_eventgroup_id >> 16 & 0xF,
+                reserved_counter_eventgroup_id & 0xFFFF,
+            )
+            for (
+                type_field,
+                index_first_option_run,
+                index_second_option_run,
+                number_of_options,
+                service_id,
+                instance_id,
+                version_ttl,
+                reserved_counter_eventgroup_id,
+            ) in _iter_unpack_entries(series)
+        ]
+
     def __repr__(self) -> str:
         """Returns a string representation of the Eventgroup object.
 
         Returns:
             str: The string representation of the object.
         """
-        return "\n".join(
-            (
-                f"{'type field':<32}: {self.type_field}",
-                f"{'index first option run':<32}: {self.index_first_option_run}",
-                f"{'index second option run':<32}: {self.index_second_option_run}",
-                f"{'number of options 1':<32}: {self.number_of_options_1}",
-                f"{'number of options 2':<32}: {self.number_of_options_2}",
-                f"{'service id':<32}: {self.service_id}",
-                f"{'instance id':<32}: {self.instance_id}",
-                f"{'major version':<32}: {self.major_version}",
-                f"{'ttl':<32}: {self.ttl}",
-                f"{'reserved':<32}: {self.reserved}",
-                f"{'counter':<32}: {self.counter}",
-                f"{'eventgroup id':<32}: {self.eventgroup_id}",
-            )
+        return _REPR.format(
+            self.__type_field,
+            self.__index_first_option_run,
+            self.__index_second_option_run,
+            self.number_of_options_1,
+            self.number_of_options_2,
+            self.__service_id,
+            self.__instance_id,
+            self.__major_version,
+            self.__ttl,
+            self.reserved,
+            self.counter,
+            self.__eventgroup_id,
         )
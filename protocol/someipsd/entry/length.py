@@ -1,11 +1,8 @@
 __all__ = ["Length"]
 
 
-from enum import IntEnum
-
-
-class Length(IntEnum):
-    """Enumeration for Entry fields with their bit lengths."""
+class Length:
+    """Plain int constants for Entry fields with their bit lengths."""
 
     TYPE_FIELD = 8
     INDEX_FIRST_OPTION_RUN = 8
@@ -1,11 +1,47 @@
 __all__ = ["Service"]
 
 
+import struct
+from typing import List, Union
+
 from bitarray import bitarray
 from bitarray.util import ba2int, int2ba
 
 from protocol.someipsd.entry.length import Length
-from utils.series_reader import SeriesReader
+
+# The two option counts share one byte and major version and TTL share one
+# word, so they are packed as combined cells.
+_ENTRY = struct.Struct(">BBBBHHII")
+
+# Bits outside each field width, so validation is a single AND; a negative
+# value has all of them set.
+_OUTSIDE_U4 = ~0xF
+_OUTSIDE_U8 = ~0xFF
+_OUTSIDE_U16 = ~0xFFFF
+_OUTSIDE_U24 = ~0xFFFFFF
+_OUTSIDE_U32 = ~0xFFFFFFFF
+
+# The labels are padded once here rather than on every __repr__ call.
+_REPR = "\n".join(
+    f"{label:<32}: {{}}"
+    for label in (
+        "type field",
+        "index first option run",
+        "index second option run",
+        "number of options 1",
+        "number of options 2",
+        "service id",
+        "instance id",
+        "major version",
+        "ttl",
+        "minor version",
+    )
+)
+
+
+def _as_int(value: Union[int, bitarray]) -> int:
+    """Returns a field given as an int or a bitarray as an int."""
+    return value if isinstance(value, int) else ba2int(value)
 
 
 class Service:
@@ -14,8 +50,7 @@ class Service:
         "__type_field",
         "__index_first_option_run",
         "__index_second_option_run",
-        "__number_of_options_1",
-        "__number_of_options_2",
+        "__number_of_options",
         "__service_id",
         "__instance_id",
         "__major_version",
@@ -23,24 +58,51 @@ class Service:
         "__minor_version",
     )
 
+    # Length of an encoded service entry, in bytes.
+    EXPECTED_BYTES = _ENTRY.size
+
     def __init__(
         self,
         type_field: int,
         index_first_option_run: int,
         index_second_option_run: int,
-        number_of_options_1: bitarray,
-        number_of_options_2: bitarray,
+        number_of_options_1: Union[int, bitarray],
+        number_of_options_2: Union[int, bitarray],
         service_id: int,
         instance_id: int,
         major_version: int,
         ttl: int,
         minor_version: int,
     ) -> None:
+        number_of_options_1 = _as_int(number_of_options_1)
+        number_of_options_2 = _as_int(number_of_options_2)
+        if type_field & _OUTSIDE_U8:
+            raise ValueError("Invalid type field")
+        if index_first_option_run & _OUTSIDE_U8:
+            raise ValueError("Invalid index first option run")
+        if index_second_option_run & _OUTSIDE_U8:
+            raise ValueError("Invalid index second option run")
+        if number_of_options_1 & _OUTSIDE_U4:
+            raise ValueError("Invalid number of options 1")
+        if number_of_options_2 & _OUTSIDE_U4:
+            raise ValueError("Invalid number of options 2")
+        if service_id & _OUTSIDE_U16:
+            raise ValueError("Invalid service id")
+        if instance_id & _OUTSIDE_U16:
+            raise ValueError("Invalid instance id")
+        if major_version & _OUTSIDE_U8:
+            raise ValueError("Invalid major version")
+        if ttl & _OUTSIDE_U24:
+            raise ValueError("Invalid ttl")
+        if minor_version & _OUTSIDE_U32:
+            raise ValueError("Invalid minor version")
+
         self.__type_field = type_field
         self.__index_first_option_run = index_first_option_run
         self.__index_second_option_run = index_second_option_run
-        self.__number_of_options_1 = number_of_options_1
-        self.__number_of_options_2 = number_of_options_2
+        # Both option counts are kept as the one byte they share on the wire; their
+        # bitarray form is built on access.
+        self.__number_of_options = number_of_options_1 << 4 | number_of_options_2
         self.__service_id = service_id
         self.__instance_id = instance_id
         self.__major_version = major_version
@@ -81,7 +143,7 @@ class Service:
         Returns:
             bitarray: The number of options (4 bits).
         """
-        return self.__number_of_options_1
+        return int2ba(self.__number_of_options >> 4, length=Length.NUMBER_OF_OPTIONS_1)
 
     @property
     def number_of_options_2(self) -> bitarray:
@@ -90,7 +152,7 @@ class Service:
         Returns:
             bitarray: The number of options (4 bits).
         """
-        return self.__number_of_options_2
+        return int2ba(self.__number_of_options & 0xF, length=Length.NUMBER_OF_OPTIONS_2)
 
     @property
     def service_id(self) -> int:
@@ -137,28 +199,14 @@ class Service:
         """
         return self.__minor_version
 
-    @staticmethod
-    def expected_packet_length() -> int:
+    @classmethod
+    def expected_packet_length(cls) -> int:
         """Returns the length of the service entry.
 
         Returns:
-            int: The length of the service entry in bytes.
-        """
-        length = sum(
-            (
-                Length.TYPE_FIELD,
-                Length.INDEX_FIRST_OPTION_RUN,
-                Length.INDEX_SECOND_OPTION_RUN,
-                Length.NUMBER_OF_OPTIONS_1,
-                Length.NUMBER_OF_OPTIONS_2,
-                Length.SERVICE_ID,
-                Length.INSTANCE_ID,
-                Length.MAJOR_VERSION,
-                Length.TTL,
-                Length.MINOR_VERSION,
-            )
-        )
-        return length
+            int: The length of the service entry in bits.
+        """
+        return cls.EXPECTED_BYTES * 8
 
     def encode(self) -> bytes:
         """Encodes the service entry into bytes.
@@ -166,23 +214,76 @@ class Service:
         Returns:
             bytes: The byte representation of the service entry.
         """
-        series = bitarray()
-        series += int2ba(self.type_field, length=Length.TYPE_FIELD)
-        series += int2ba(
-            self.index_first_option_run, length=Length.INDEX_FIRST_OPTION_RUN
-        )
-        series += int2ba(
-            self.index_second_option_run, length=Length.INDEX_SECOND_OPTION_RUN
+        return _ENTRY.pack(
+            self.__type_field,
+            self.__index_first_option_run,
+            self.__index_second_option_run,
+            self.__number_of_options,
+            self.__service_id,
+            self.__instance_id,
+            self.__major_version << 24 | self.__ttl,
+            self.__minor_version,
         )
-        series += self.number_of_options_1
-        series += self.number_of_options_2
-        series += int2ba(self.service_id, length=Length.SERVICE_ID)
-        series += int2ba(self.instance_id, length=Length.INSTANCE_ID)
-        series += int2ba(self.major_version, length=Length.MAJOR_VERSION)
-        series += int2ba(self.ttl, length=Length.TTL)
-        series += int2ba(self.minor_version, length=Length.MINOR_VERSION)
 
-        return series.tobytes()
+    @classmethod
+    def encode_many(cls, entries: List["Service"]) -> bytes:
+        """Encodes several service entries into one byte series.
+
+        Each entry is packed on its own and the results are joined once, so the
+        output is built in a single copy with no growing or resized buffer.
+
+        Args:
+            entries (List[Service]): The service entries to encode.
+
+        Returns:
+            bytes: The concatenated byte representation of the entries, in order.
+        """
+        return b"".join([entry.encode() for entry in entries])
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        type_field: int,
+        index_first_option_run: int,
+        index_second_option_run: int,
+        number_of_options: int,
+        service_id: int,
+        instance_id: int,
+        major_version: int,
+        ttl: int,
+        minor_version: int,
+    ) -> "Service":
+        """Creates an entry from int fields that are already known to be in range.
+
+        Skips ``__init__``, so no keyword binding, conversion or validation takes
+        place. Only meant for values masked out of a fixed-width entry.
+
+        Args:
+            type_field (int): The type field (8 bits).
+            index_first_option_run (int): The index of the first option run (8 bits).
+            index_second_option_run (int): The index of the second option run (8 bits).
+            number_of_options (int): The number of options of the first option run
+                in the high nibble and of the second one in the low nibble (8 bits).
+            service_id (int): The service ID (16 bits).
+            instance_id (int): The instance ID (16 bits).
+            major_version (int): The major version (8 bits).
+            ttl (int): The TTL value (24 bits).
+            minor_version (int): The minor version (32 bits).
+
+        Returns:
+            Service: The created service entry object.
+        """
+        entry = cls.__new__(cls)
+        entry.__type_field = type_field
+        entry.__index_first_option_run = index_first_option_run
+        entry.__index_second_option_run = index_second_option_run
+        entry.__number_of_options = number_of_options
+        entry.__service_id = service_id
+        entry.__instance_id = instance_id
+        entry.__major_version = major_version
+        entry.__ttl = ttl
+        entry.__minor_version = minor_version
+        return entry
 
     @classmethod
     def decode(cls, series: bytes) -> "Service":
@@ -197,54 +298,93 @@ class Service:
         Raises:
             ValueError: If the byte series has an invalid length.
         """
-        packet = bitarray()
-        packet.frombytes(series)
-
-        if len(packet) != cls.expected_packet_length():
+        if len(series) != cls.EXPECTED_BYTES:
             raise ValueError("Invalid service entry length")
 
-        reader = SeriesReader(packet)
-        type_field = ba2int(reader.read(Length.TYPE_FIELD))
-        index_first_option_run = ba2int(reader.read(Length.INDEX_FIRST_OPTION_RUN))
-        index_second_option_run = ba2int(reader.read(Length.INDEX_SECOND_OPTION_RUN))
-        number_of_options_1 = reader.read(Length.NUMBER_OF_OPTIONS_1)
-        number_of_options_2 = reader.read(Length.NUMBER_OF_OPTIONS_2)
-        service_id = ba2int(reader.read(Length.SERVICE_ID))
-        instance_id = ba2int(reader.read(Length.INSTANCE_ID))
-        major_version = ba2int(reader.read(Length.MAJOR_VERSION))
-        ttl = ba2int(reader.read(Length.TTL))
-        minor_version = ba2int(reader.read(Length.MINOR_VERSION))
-
-        return cls(
-            type_field=type_field,
-            index_first_option_run=index_first_option_run,
-            index_second_option_run=index_second_option_run,
-            number_of_options_1=number_of_options_1,
-            number_of_options_2=number_of_options_2,
-            service_id=service_id,
-            instance_id=instance_id,
-            major_version=major_version,
-            ttl=ttl,
-            minor_version=minor_version,
+        (
+            type_field,
+            index_first_option_run,
+            index_second_option_run,
+            number_of_options,
+            service_id,
+            instance_id,
+            version_ttl,
+            minor_version,
+        ) = _ENTRY.unpack(series)
+        major_version = version_ttl >> 24
+        ttl = version_ttl & 0xFFFFFF
+
+        return cls._from_trusted(
+            type_field,
+            index_first_option_run,
+            index_second_option_run,
+            number_of_options,
+            service_id,
+            instance_id,
+            major_version,
+            ttl,
+            minor_version,
         )
 
+    @classmethod
+    def decode_many(cls, series: bytes) -> List["Service"]:
+        """Decodes consecutive service entries from a byte series.
+
+        All entries are unpacked in one C-level pass over the buffer, so the
+        per-entry Python work is limited to splitting the shared cells and
+        creating the object without validation.
+
+        Args:
+            series (bytes): The byte series holding the service entries.
+
+        Returns:
+            List[Service]: The decoded service entry objects, in order.
+
+        Raises:
+            ValueError: If the byte series is not a whole number of entries.
+        """
+        if len(series) % cls.EXPECTED_BYTES:
+            raise ValueError("Invalid service entries length")
+
+        return [
+            cls._from_trusted(
+                type_field,
+                index_first_option_run,
+                index_second_option_run,
+                number_of_options,
+                service_id,
+                instance_id,
+                version_ttl >> 24,
+                version_ttl & 0xFFFFFF,
+                minor_version,
+            )
+            for (
+                type_field,
+                index_first_option_run,
+                index_second_option_run,
+                number_of_options,
+                service_id,
+                instance_id,
+                version_ttl,
+                minor_version,
+            ) in _ENTRY.iter_unpack(series)
+        ]
+
     def __repr__(self) -> str:
         """Returns a string representation of the ServiceEntry object.
 
         Returns:
             str: The string representation of the object.
         """
-        return "\n".join(
-            (
-                f"{'type field':<32}: {self.type_field}",
-                f"{'index first option run':<32}: {self.index_first_option_run}",
-                f"{'index second option run':<32}: {self.index_second_option_run}",
-                f"{'number of options 1':<32}: {self.number_of_options_1}",
-                f"{'number of options 2':<32}: {self.number_of_options_2}",
-                f"{'service id':<32}: {self.service_id}",
-                f"{'instance id':<32}: {self.instance_id}",
-                f"{'major version':<32}: {self.major_version}",
-                f"{'ttl':<32}: {self.ttl}",
-                f"{'minor version':<32}: {self.minor_version}",
-            )
+        return _REPR.format(
+            self.__type_field,
+            self.__index_first_option_run,
+            self.__index_second_option_run,
+            self.number_of_options_1,
+            self.number_of_options_2,
+            self.__service_id,
+            self.__instance_id,
+            self.__major_version,
+            self.__ttl,
+            self.__minor_version,
         )
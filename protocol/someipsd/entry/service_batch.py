@@ -0,0 +1,259 @@
+__all__ = ["ServiceBatch"]
+
+
+from array import array
+from typing import Iterable
+
+from protocol.someipsd.entry.eventgroup_batch import (
+    _HIGH_NIBBLE,
+    _LOW_NIBBLE,
+    _check_columns,
+)
+from protocol.someipsd.entry.service import _ENTRY, Service
+
+_ENTRY_SIZE = _ENTRY.size
+
+
+class ServiceBatch:
+    """
+    Columnar storage for a batch of service entries.
+
+    Each field is held in its own typed ``array.array`` across all entries
+    instead of one object per entry, so a batch costs a few bytes per entry
+    and a field can be scanned or filtered without touching the others.
+    ``row`` builds a ``Service`` for a single entry on demand.
+
+    The columns may be changed in place; ``encode_all`` checks that they are
+    still equally long and that every value fits its field.
+    """
+
+    __slots__ = (
+        "__type_field",
+        "__index_first_option_run",
+        "__index_second_option_run",
+        "__number_of_options_1",
+        "__number_of_options_2",
+        "__service_id",
+        "__instance_id",
+        "__major_version",
+        "__ttl",
+        "__minor_version",
+    )
+
+    def __init__(self) -> None:
+        """Initializes an empty batch."""
+        self.__type_field = array("B")
+        self.__index_first_option_run = array("B")
+        self.__index_second_option_run = array("B")
+        self.__number_of_options_1 = array("B")
+        self.__number_of_options_2 = array("B")
+        self.__service_id = array("H")
+        self.__instance_id = array("H")
+        self.__major_version = array("B")
+        self.__ttl = array("I")
+        self.__minor_version = array("I")
+
+    @property
+    def type_field(self) -> array:
+        """Returns the type fields (8 bits each)."""
+        return self.__type_field
+
+    @property
+    def index_first_option_run(self) -> array:
+        """Returns the indexes of the first option run (8 bits each)."""
+        return self.__index_first_option_run
+
+    @property
+    def index_second_option_run(self) -> array:
+        """Returns the indexes of the second option run (8 bits each)."""
+        return self.__index_second_option_run
+
+    @property
+    def number_of_options_1(self) -> array:
+        """Returns the numbers of options in the first option run (4 bits each)."""
+        return self.__number_of_options_1
+
+    @property
+    def number_of_options_2(self) -> array:
+        """Returns the numbers of options in the second option run (4 bits each)."""
+        return self.__number_of_options_2
+
+    @property
+    def service_id(self) -> array:
+        """Returns the service identifiers (16 bits each)."""
+        return self.__service_id
+
+    @property
+    def instance_id(self) -> array:
+        """Returns the instance identifiers (16 bits each)."""
+        return self.__instance_id
+
+    @property
+    def major_version(self) -> array:
+        """Returns the major versions (8 bits each)."""
+        return self.__major_version
+
+    @property
+    def ttl(self) -> array:
+        """Returns the time-to-live values (24 bits each)."""
+        return self.__ttl
+
+    @property
+    def minor_version(self) -> array:
+        """Returns the minor versions (32 bits each)."""
+        return self.__minor_version
+
+    def __len__(self) -> int:
+        """Returns the number of entries in the batch."""
+        return len(self.__type_field)
+
+    @classmethod
+    def decode_all(cls, series: bytes) -> "ServiceBatch":
+        """Decodes consecutive service entries from a byte series into a batch.
+
+        Args:
+            series (bytes): The byte series holding the service entries.
+
+        Returns:
+            ServiceBatch: The decoded batch.
+
+        Raises:
+            ValueError: If the byte series is not a whole number of entries.
+        """
+        if len(series) % _ENTRY_SIZE:
+            raise ValueError("Invalid service entries length")
+
+        batch = cls()
+        if not series:
+            return batch
+
+        # The byte-wide fields are gathered with strided slices and the nibbles
+        # split with byte translation, all in C; only the fields sharing a word
+        # need a per-entry Python step.
+        series = bytes(series)
+        batch.__type_field = array("B", series[0::_ENTRY_SIZE])
+        batch.__index_first_option_run = array("B", series[1::_ENTRY_SIZE])
+        batch.__index_second_option_run = array("B", series[2::_ENTRY_SIZE])
+        number_of_options = series[3::_ENTRY_SIZE]
+        batch.__number_of_options_1 = array(
+            "B", number_of_options.translate(_HIGH_NIBBLE)
+        )
+        batch.__number_of_options_2 = array(
+            "B", number_of_options.translate(_LOW_NIBBLE)
+        )
+        batch.__major_version = array("B", series[8::_ENTRY_SIZE])
+
+        (
+            _,
+            _,
+            _,
+            _,
+            service_id,
+            instance_id,
+            version_ttl,
+            minor_version,
+        ) = zip(*_ENTRY.iter_unpack(series))
+        batch.__service_id = array("H", service_id)
+        batch.__instance_id = array("H", instance_id)
+        batch.__ttl = array("I", [value & 0xFFFFFF for value in version_ttl])
+        batch.__minor_version = array("I", minor_version)
+        return batch
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Service]) -> "ServiceBatch":
+        """Builds a batch from service entry objects.
+
+        Args:
+            entries (Iterable[Service]): The service entries.
+
+        Returns:
+            ServiceBatch: The batch holding the entries, in order.
+        """
+        return cls.decode_all(Service.encode_many(list(entries)))
+
+    def encode_all(self) -> bytes:
+        """Encodes every entry of the batch into one byte series.
+
+        Returns:
+            bytes: The concatenated byte representation of the entries.
+
+        Raises:
+            ValueError: If the columns differ in length or a value does not fit
+                its field.
+        """
+        length = _check_columns(
+            (
+                ("type field", self.__type_field, 0xFF),
+                ("index first option run", self.__index_first_option_run, 0xFF),
+                ("index second option run", self.__index_second_option_run, 0xFF),
+                ("number of options 1", self.__number_of_options_1, 0xF),
+                ("number of options 2", self.__number_of_options_2, 0xF),
+                ("service id", self.__service_id, 0xFFFF),
+                ("instance id", self.__instance_id, 0xFFFF),
+                ("major version", self.__major_version, 0xFF),
+                ("ttl", self.__ttl, 0xFFFFFF),
+                ("minor version", self.__minor_version, 0xFFFFFFFF),
+            )
+        )
+        series = bytearray(length * _ENTRY_SIZE)
+        pack_into = _ENTRY.pack_into
+        for offset, (
+            type_field,
+            index_first_option_run,
+            index_second_option_run,
+            number_of_options_1,
+            number_of_options_2,
+            service_id,
+            instance_id,
+            major_version,
+            ttl,
+            minor_version,
+        ) in zip(
+            range(0, len(series), _ENTRY_SIZE),
+            zip(
+                self.__type_field,
+                self.__index_first_option_run,
+                self.__index_second_option_run,
+                self.__number_of_options_1,
+                self.__number_of_options_2,
+                self.__service_id,
+                self.__instance_id,
+                self.__major_version,
+                self.__ttl,
+                self.__minor_version,
+            ),
+        ):
+            pack_into(
+                series,
+                offset,
+                type_field,
+                index_first_option_run,
+                index_second_option_run,
+                number_of_options_1 << 4 | number_of_options_2,
+                service_id,
+                instance_id,
+                major_version << 24 | ttl,
+                minor_version,
+            )
+        return bytes(series)
+
+    def row(self, index: int) -> Service:
+        """Builds the service entry object at an index of the batch.
+
+        Args:
+            index (int): The index of the entry.
+
+        Returns:
+            Service: The service entry.
+        """
+        return Service._from_trusted(
+            self.__type_field[index],
+            self.__index_first_option_run[index],
+            self.__index_second_option_run[index],
+            self.__number_of_options_1[index] << 4 | self.__number_of_options_2[index],
+            self.__service_id[index],
+            self.__instance_id[index],
+            self.__major_version[index],
+            self.__ttl[index],
+            self.__minor_version[index],
+        )
@@ -1,4 +1,13 @@
-__all__ = ["Type"]
+__all__ = [
+    "Type",
+    "FIND_SERVICE",
+    "OFFER_SERVICE",
+    "STOP_OFFER_SERVICE",
+    "SUBSCRIBE_EVENTGROUP",
+    "STOP_SUBSCRIBE_EVENTGROUP",
+    "SUBSCRIBE_EVENTGROUP_ACK",
+    "SUBSCRIBE_EVENTGROUP_NACK",
+]
 
 
 from enum import IntEnum
@@ -29,3 +38,14 @@ class Type(IntEnum):
     STOP_SUBSCRIBE_EVENTGROUP = 0x06
     SUBSCRIBE_EVENTGROUP_ACK = 0x07
     SUBSCRIBE_EVENTGROUP_NACK = 0x07
+
+
+# Plain int values of the members, for encode/decode paths that build or compare
+# type fields without going through IntEnum member lookup and dispatch.
+FIND_SERVICE = Type.FIND_SERVICE.value
+OFFER_SERVICE = Type.OFFER_SERVICE.value
+STOP_OFFER_SERVICE = Type.STOP_OFFER_SERVICE.value
+SUBSCRIBE_EVENTGROUP = Type.SUBSCRIBE_EVENTGROUP.value
+STOP_SUBSCRIBE_EVENTGROUP = Type.STOP_SUBSCRIBE_EVENTGROUP.value
+SUBSCRIBE_EVENTGROUP_ACK = Type.SUBSCRIBE_EVENTGROUP_ACK.value
+SUBSCRIBE_EVENTGROUP_NACK = Type.SUBSCRIBE_EVENTGROUP_NACK.value
@@ -1,11 +1,8 @@
 __all__ = ["Length"]
 
 
-from enum import IntEnum
-
-
-class Length(IntEnum):
-    """Enumeration for message fields with associated bit lengths."""
+class Length:
+    """Plain int constants for message fields with associated bit lengths."""
 
     SERVICE_ID = 16
     METHOD_ID = 16
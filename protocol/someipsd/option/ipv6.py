@@ -2,12 +2,45 @@ __all__ = ["IPv6"]
 
 
 import ipaddress
+import socket
+import struct
+from typing import Union
 
 from bitarray import bitarray
 from bitarray.util import ba2int, int2ba
 
 from protocol.someipsd.option.length import Length
-from utils.series_reader import SeriesReader
+
+# The discardable flag and bits 1 to 7 share one byte, so they are packed as a
+# single cell.
+_OPTION = struct.Struct(">HBB16sBBH")
+
+# Bits outside each field width, so validation is a single AND; a negative
+# value has all of them set.
+_OUTSIDE_U1 = ~0x1
+_OUTSIDE_U7 = ~0x7F
+_OUTSIDE_U8 = ~0xFF
+_OUTSIDE_U16 = ~0xFFFF
+
+# The labels are padded once here rather than on every __repr__ call.
+_REPR = "\n".join(
+    f"{label:<32}: {{}}"
+    for label in (
+        "length",
+        "type",
+        "discardable flag",
+        "bit 1 to bit 7",
+        "ipv6 address",
+        "reserved",
+        "transport protocol",
+        "transport protocol port number",
+    )
+)
+
+
+def _as_int(value: Union[int, bitarray]) -> int:
+    """Returns a field given as an int or a bitarray as an int."""
+    return value if isinstance(value, int) else ba2int(value)
 
 
 class IPv6:
@@ -19,25 +52,50 @@ class IPv6:
         "__discardable_flag",
         "__bit_1_to_bit_7",
         "__ipv6_address",
+        "__ipv6_address_packed",
         "__reserved",
         "__transport_protocol",
         "__transport_protocol_port_number",
     )
 
+    # Length of an encoded IPv6 option, in bytes.
+    EXPECTED_BYTES = _OPTION.size
+
     def __init__(
         self,
         type: int,
-        discardable_flag: bitarray,
-        bit_1_to_bit_7: bitarray,
+        discardable_flag: Union[int, bitarray],
+        bit_1_to_bit_7: Union[int, bitarray],
         ipv6_address: str,
         reserved: int,
         transport_protocol: int,
         transport_protocol_port_number: int,
     ) -> None:
+        discardable_flag = _as_int(discardable_flag)
+        bit_1_to_bit_7 = _as_int(bit_1_to_bit_7)
+        if type & _OUTSIDE_U8:
+            raise ValueError("Invalid type")
+        if discardable_flag & _OUTSIDE_U1:
+            raise ValueError("Invalid discardable flag")
+        if bit_1_to_bit_7 & _OUTSIDE_U7:
+            raise ValueError("Invalid bit 1 to bit 7")
+        if reserved & _OUTSIDE_U8:
+            raise ValueError("Invalid reserved")
+        if transport_protocol & _OUTSIDE_U8:
+            raise ValueError("Invalid transport protocol")
+        if transport_protocol_port_number & _OUTSIDE_U16:
+            raise ValueError("Invalid transport protocol port number")
+
         self.__type = type
+        # The flag bits are stored as ints; their bitarray form is built on access.
         self.__discardable_flag = discardable_flag
         self.__bit_1_to_bit_7 = bit_1_to_bit_7
         self.__ipv6_address = ipv6_address
+        # Parsed once here so encode only copies the sixteen address bytes.
+        try:
+            self.__ipv6_address_packed = socket.inet_pton(socket.AF_INET6, ipv6_address)
+        except OSError:
+            raise ValueError("Invalid ipv6 address") from None
         self.__reserved = reserved
         self.__transport_protocol = transport_protocol
         self.__transport_protocol_port_number = transport_protocol_port_number
@@ -50,16 +108,22 @@ class IPv6:
     @property
     def discardable_flag(self) -> bitarray:
         """Returns the discardable flag of the IPv6 option."""
-        return self.__discardable_flag
+        return int2ba(self.__discardable_flag, length=Length.DISCARDABLE_FLAG)
 
     @property
     def bit_1_to_bit_7(self) -> bitarray:
         """Returns the bits 1 to 7 of the IPv6 option."""
-        return self.__bit_1_to_bit_7
+        return int2ba(self.__bit_1_to_bit_7, length=Length.BIT_1_TO_BIT_7)
 
     @property
     def ipv6_address(self) -> str:
-        """Returns the IPv6 address as a string."""
+        """Returns the IPv6 address as a string.
+
+        A decoded option only holds the packed address; the string is built on
+        first access, in the form ``ipaddress`` gives it, and kept.
+        """
+        if self.__ipv6_address is None:
+            self.__ipv6_address = str(ipaddress.IPv6Address(self.__ipv6_address_packed))
         return self.__ipv6_address
 
     @property
@@ -82,26 +146,14 @@ class IPv6:
         """Returns the fixed length of the IPv6 option (0x0015)."""
         return 0x0015
 
-    @staticmethod
-    def expected_packet_length() -> int:
+    @classmethod
+    def expected_packet_length(cls) -> int:
         """Returns the expected length of the IPv6 option packet.
 
         Returns:
             int: The expected length of the IPv6 option packet.
         """
-        length = sum(
-            (
-                Length.LENGTH,
-                Length.TYPE,
-                Length.DISCARDABLE_FLAG,
-                Length.BIT_1_TO_BIT_7,
-                Length.IPV6_ADDRESS,
-                Length.RESERVED,
-                Length.TRANSPORT_PROTOCOL,
-                Length.TRANSPORT_PROTOCOL_PORT_NUMBER,
-            )
-        )
-        return length
+        return cls.EXPECTED_BYTES * 8
 
     def encode(self) -> bytes:
         """Encodes the IPv6 option into a byte sequence.
@@ -109,20 +161,55 @@ class IPv6:
         Returns:
             bytes: The encoded byte representation of the IPv6 option.
         """
-        series = bitarray()
-        series += int2ba(self.length, length=Length.LENGTH)
-        series += int2ba(self.type, length=Length.TYPE)
-        series += self.discardable_flag
-        series += self.bit_1_to_bit_7
-        series.frombytes(ipaddress.ip_address(self.ipv6_address).packed)
-        series += int2ba(self.reserved, length=Length.RESERVED)
-        series += int2ba(self.transport_protocol, length=Length.TRANSPORT_PROTOCOL)
-        series += int2ba(
-            self.transport_protocol_port_number,
-            length=Length.TRANSPORT_PROTOCOL_PORT_NUMBER,
+        return _OPTION.pack(
+            0x0015,
+            self.__type,
+            self.__discardable_flag << 7 | self.__bit_1_to_bit_7,
+            self.__ipv6_address_packed,
+            self.__reserved,
+            self.__transport_protocol,
+            self.__transport_protocol_port_number,
         )
 
-        return series.tobytes()
+    @classmethod
+    def _from_trusted(
+        cls,
+        type: int,
+        discardable_flag: int,
+        bit_1_to_bit_7: int,
+        ipv6_address_packed: bytes,
+        reserved: int,
+        transport_protocol: int,
+        transport_protocol_port_number: int,
+    ) -> "IPv6":
+        """Creates an option from fields that are already known to be well-formed.
+
+        Skips ``__init__``, so no conversion or validation takes place and the
+        address is kept packed until it is read. Only meant for values unpacked
+        from a fixed-width option.
+
+        Args:
+            type (int): The type of the option (8 bits).
+            discardable_flag (int): The discardable flag (1 bit).
+            bit_1_to_bit_7 (int): The bits 1 to 7 (7 bits).
+            ipv6_address_packed (bytes): The IPv6 address in network byte order.
+            reserved (int): The reserved field (8 bits).
+            transport_protocol (int): The transport protocol number (8 bits).
+            transport_protocol_port_number (int): The port number (16 bits).
+
+        Returns:
+            IPv6: The created IPv6 object.
+        """
+        option = cls.__new__(cls)
+        option.__type = type
+        option.__discardable_flag = discardable_flag
+        option.__bit_1_to_bit_7 = bit_1_to_bit_7
+        option.__ipv6_address = None
+        option.__ipv6_address_packed = ipv6_address_packed
+        option.__reserved = reserved
+        option.__transport_protocol = transport_protocol
+        option.__transport_protocol_port_number = transport_protocol_port_number
+        return option
 
     @classmethod
     def decode(cls, series: bytes) -> "IPv6":
@@ -137,47 +224,37 @@ class IPv6:
         Raises:
             ValueError: If the length of the byte sequence is invalid.
         """
-        packet = bitarray()
-        packet.frombytes(series)
-
-        if len(packet) != cls.expected_packet_length():
+        if len(series) != cls.EXPECTED_BYTES:
             raise ValueError("Invalid message length")
 
-        reader = SeriesReader(packet)
-        _ = reader.read(Length.LENGTH)
-        type_ = ba2int(reader.read(Length.TYPE))
-        discardable_flag = reader.read(Length.DISCARDABLE_FLAG)
-        bit_1_to_bit_7 = reader.read(Length.BIT_1_TO_BIT_7)
-        ipv6_address = str(
-            ipaddress.ip_address(reader.read(Length.IPV6_ADDRESS).tobytes())
-        )
-        reserved = ba2int(reader.read(Length.RESERVED))
-        transport_protocol = ba2int(reader.read(Length.TRANSPORT_PROTOCOL))
-        transport_protocol_port_number = ba2int(
-            reader.read(Length.TRANSPORT_PROTOCOL_PORT_NUMBER)
-        )
-
-        return cls(
-            type=type_,
-            discardable_flag=discardable_flag,
-            bit_1_to_bit_7=bit_1_to_bit_7,
-            ipv6_address=ipv6_address,
-            reserved=reserved,
-            transport_protocol=transport_protocol,
-            transport_protocol_port_number=transport_protocol_port_number,
+        (
+            _,
+            type_,
+            flags,
+            ipv6_address_packed,
+            reserved,
+            transport_protocol,
+            transport_protocol_port_number,
+        ) = _OPTION.unpack(series)
+        return cls._from_trusted(
+            type_,
+            flags >> 7,
+            flags & 0x7F,
+            ipv6_address_packed,
+            reserved,
+            transport_protocol,
+            transport_protocol_port_number,
         )
 
     def __repr__(self) -> str:
         """Returns a string representation of the IPv6 object."""
-        return "\n".join(
-            (
-                f"{'length':<32}: {self.length}",
-                f"{'type':<32}: {self.type}",
-                f"{'discardable flag':<32}: {self.discardable_flag}",
-                f"{'bit 1 to bit 7':<32}: {self.bit_1_to_bit_7}",
-                f"{'ipv6 address':<32}: {self.ipv6_address}",
-                f"{'reserved':<32}: {self.reserved}",
-                f"{'transport protocol':<32}: {self.transport_protocol}",
-                f"{'transport protocol port number':<32}: {self.transport_protocol_port_number}",
-            )
+        return _REPR.format(
+            self.length,
+            self.__type,
+            self.discardable_flag,
+            self.bit_1_to_bit_7,
+            self.ipv6_address,
+            self.__reserved,
+            self.__transport_protocol,
+            self.__transport_protocol_port_number,
         )
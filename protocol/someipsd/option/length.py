@@ -1,11 +1,8 @@
 __all__ = ["Length"]
 
 
-from enum import IntEnum
-
-
-class Length(IntEnum):
-    """Enumeration for message fields with their bit lengths."""
+class Length:
+    """Plain int constants for message fields with their bit lengths."""
 
     LENGTH = 16
     TYPE = 8
@@ -1,4 +1,11 @@
-__all__ = ["Type"]
+__all__ = [
+    "Type",
+    "CONFIGURATION",
+    "IPV4_ENDPOINT",
+    "IPV6_ENDPOINT",
+    "IPV4_MULTICAST",
+    "IPV6_MULTICAST",
+]
 
 
 from enum import IntEnum
@@ -23,3 +30,12 @@ class Type(IntEnum):
     IPV6_ENDPOINT = 0x06
     IPV4_MULTICAST = 0x14
     IPV6_MULTICAST = 0x16
+
+
+# Plain int values of the members, for encode/decode paths that build or compare
+# type fields without going through IntEnum member lookup and dispatch.
+CONFIGURATION = Type.CONFIGURATION.value
+IPV4_ENDPOINT = Type.IPV4_ENDPOINT.value
+IPV6_ENDPOINT = Type.IPV6_ENDPOINT.value
+IPV4_MULTICAST = Type.IPV4_MULTICAST.value
+IPV6_MULTICAST = Type.IPV6_MULTICAST.value
@@ -1,11 +1,42 @@
 __all__ = ["Packet"]
 
 
-from bitarray import bitarray
-from bitarray.util import ba2int, int2ba
-
-from protocol.someipsd.length import Length
-from utils.series_reader import SeriesReader
+import struct
+from typing import TYPE_CHECKING, Callable, List, Tuple
+
+if TYPE_CHECKING:
+    from protocol.someipsd.packet_view import PacketView
+
+# SOME/IP header, flags and reserved, and the length of the entries array, in
+# network byte order. The 8-bit flags and 24-bit reserved field share one word.
+_HEADER = struct.Struct(">HHIHHBBBBII")
+# Length of the options array, which follows the entries array.
+_OPTIONS_LENGTH = struct.Struct(">I")
+# Bytes counted by Packet.length besides the two arrays: the header struct
+# without the entries array length.
+_MINIMUM_LENGTH = _HEADER.size - 4
+
+# The labels are padded once here rather than on every __repr__ call.
+_REPR = "\n".join(
+    f"{label:<24}: {{}}"
+    for label in (
+        "service id",
+        "method id",
+        "length",
+        "client id",
+        "session id",
+        "protocol version",
+        "interface version",
+        "message type",
+        "return code",
+        "flags",
+        "reserved",
+        "length of entries array",
+        "entries array",
+        "length of options array",
+        "options array",
+    )
+)
 
 
 class Packet:
@@ -23,6 +54,9 @@ class Packet:
         "__reserved",
         "__entries_array",
         "__options_array",
+        "__length_of_entries_array",
+        "__length_of_options_array",
+        "__length",
     )
 
     def __init__(
@@ -40,6 +74,36 @@ class Packet:
         entries_array: bytes,
         options_array: bytes,
     ):
+        # One OR reduction per field width; a negative value shifts to -1 and
+        # fails as well.
+        if (
+            (service_id | method_id | client_id | session_id) >> 16
+            or (
+                protocol_version
+                | interface_version
+                | message_type
+                | return_code
+                | flags
+            )
+            >> 8
+            or reserved >> 24
+        ):
+            # Slow path only: find the field to report.
+            for value, bits, label in (
+                (service_id, 16, "service id"),
+                (method_id, 16, "method id"),
+                (client_id, 16, "client id"),
+                (session_id, 16, "session id"),
+                (protocol_version, 8, "protocol version"),
+                (interface_version, 8, "interface version"),
+                (message_type, 8, "message type"),
+                (return_code, 8, "return code"),
+                (flags, 8, "flags"),
+                (reserved, 24, "reserved"),
+            ):
+                if value >> bits:
+                    raise ValueError(f"Invalid {label}")
+
         self.__service_id = service_id
         self.__method_id = method_id
         self.__client_id = client_id
@@ -52,6 +116,14 @@ class Packet:
         self.__reserved = reserved
         self.__entries_array = bytes(entries_array)
         self.__options_array = bytes(options_array)
+        # The arrays are immutable, so the lengths derived from them are fixed.
+        self.__length_of_entries_array = len(self.__entries_array)
+        self.__length_of_options_array = len(self.__options_array)
+        self.__length = (
+            _MINIMUM_LENGTH
+            + self.__length_of_entries_array
+            + self.__length_of_options_array
+        )
 
     @property
     def service_id(self) -> int:
@@ -106,7 +178,7 @@ class Packet:
     @property
     def length_of_entries_array(self) -> int:
         """Returns the length of the entries array."""
-        return len(self.entries_array)
+        return self.__length_of_entries_array
 
     @property
     def entries_array(self) -> bytes:
@@ -116,7 +188,7 @@ class Packet:
     @property
     def length_of_options_array(self) -> int:
         """Returns the length of the options array."""
-        return len(self.options_array)
+        return self.__length_of_options_array
 
     @property
     def options_array(self) -> bytes:
@@ -126,11 +198,7 @@ class Packet:
     @property
     def length(self) -> int:
         """Returns the total length of the packet including headers and arrays."""
-        return (
-            Packet.expected_minimum_length() // 8
-            + self.length_of_entries_array
-            + self.length_of_options_array
-        )
+        return self.__length
 
     @staticmethod
     def expected_minimum_length() -> int:
@@ -139,22 +207,7 @@ class Packet:
         Returns:
             int: The expected length of the packet in bytes.
         """
-        length = sum(
-            (
-                Length.SERVICE_ID,
-                Length.METHOD_ID,
-                Length.LENGTH,
-                Length.CLIENT_ID,
-                Length.SESSION_ID,
-                Length.PROTOCOL_VERSION,
-                Length.INTERFACE_VERSION,
-                Length.MESSAGE_TYPE,
-                Length.RETURN_CODE,
-                Length.FLAGS,
-                Length.RESERVED,
-            )
-        )
-        return length
+        return _MINIMUM_LENGTH * 8
 
     def encode(self) -> bytes:
         """Encodes the packet into a byte sequence.
@@ -162,29 +215,195 @@ class Packet:
         Returns:
             bytes: The encoded byte sequence representing the packet.
         """
+        return b"".join(self.__parts())
+
+    def __parts(self) -> Tuple[bytes, bytes, bytes, bytes]:
+        """Returns the header, entries array, options array length and options
+        array, whose concatenation is the encoded packet."""
+        return (
+            _HEADER.pack(
+                self.__service_id,
+                self.__method_id,
+                self.__length,
+                self.__client_id,
+                self.__session_id,
+                self.__protocol_version,
+                self.__interface_version,
+                self.__message_type,
+                self.__return_code,
+                self.__flags << 24 | self.__reserved,
+                self.__length_of_entries_array,
+            ),
+            self.__entries_array,
+            _OPTIONS_LENGTH.pack(self.__length_of_options_array),
+            self.__options_array,
+        )
+
+    def encode_into(self, buffer: bytearray, offset: int = 0) -> int:
+        """Encodes the packet into a preallocated writable buffer.
+
+        Header, both arrays and the options array length are written in place,
+        so no intermediate ``bytes`` objects are built.
+
+        Args:
+            buffer (bytearray): The buffer to write to, large enough to hold the
+                packet from ``offset`` on.
+            offset (int): The position in the buffer at which to start writing.
+
+        Returns:
+            int: The number of bytes written.
 
-        series = bitarray()
-        series += int2ba(self.service_id, length=Length.SERVICE_ID)
-        series += int2ba(self.method_id, length=Length.METHOD_ID)
-        series += int2ba(self.length, length=Length.LENGTH)
-        series += int2ba(self.client_id, length=Length.CLIENT_ID)
-        series += int2ba(self.session_id, length=Length.SESSION_ID)
-        series += int2ba(self.protocol_version, length=Length.PROTOCOL_VERSION)
-        series += int2ba(self.interface_version, length=Length.INTERFACE_VERSION)
-        series += int2ba(self.message_type, length=Length.MESSAGE_TYPE)
-        series += int2ba(self.return_code, length=Length.RETURN_CODE)
-        series += int2ba(self.flags, length=Length.FLAGS)
-        series += int2ba(self.reserved, length=Length.RESERVED)
-        series += int2ba(
-            self.length_of_entries_array, length=Length.LENGTH_OF_ENTRIES_ARRAY
+        Raises:
+            ValueError: If the buffer is too small.
+        """
+        size = self.__length + 8
+        if len(buffer) - offset < size:
+            raise ValueError("Buffer too small for SOME/IP SD packet")
+        _HEADER.pack_into(
+            buffer,
+            offset,
+            self.__service_id,
+            self.__method_id,
+            self.__length,
+            self.__client_id,
+            self.__session_id,
+            self.__protocol_version,
+            self.__interface_version,
+            self.__message_type,
+            self.__return_code,
+            self.__flags << 24 | self.__reserved,
+            self.__length_of_entries_array,
         )
-        series.frombytes(self.entries_array)
-        series += int2ba(
-            self.length_of_options_array, length=Length.LENGTH_OF_OPTIONS_ARRAY
+        position = offset + _HEADER.size
+        end = position + self.__length_of_entries_array
+        buffer[position:end] = self.__entries_array
+        _OPTIONS_LENGTH.pack_into(buffer, end, self.__length_of_options_array)
+        position = end + _OPTIONS_LENGTH.size
+        buffer[position : offset + size] = self.__options_array
+        return size
+
+    @classmethod
+    def encode_many(cls, packets: List["Packet"]) -> bytes:
+        """Encodes several packets into one byte series.
+
+        The parts of every packet are joined in one pass, so the arrays are
+        copied once. Each packet still packs its header and options array
+        length into two small ``bytes`` objects, but no per-packet encoding is
+        built and copied again.
+
+        Args:
+            packets (List[Packet]): The packets to encode.
+
+        Returns:
+            bytes: The concatenated byte representation of the packets, in order.
+        """
+        return b"".join(part for packet in packets for part in packet.__parts())
+
+    @classmethod
+    def compile_template(
+        cls,
+        service_id: int,
+        method_id: int,
+        protocol_version: int,
+        interface_version: int,
+        message_type: int,
+        return_code: int,
+        flags: int,
+        reserved: int,
+    ) -> Callable[[int, int, bytes, bytes], bytes]:
+        """Builds an encoder for packets sharing every header field but the IDs.
+
+        The shared fields are validated once here and bound into the returned
+        function, which packs the header in one call without creating a Packet.
+        Its output equals ``Packet(...).encode()`` for the same fields.
+
+        Args:
+            service_id (int): The service ID (16 bits).
+            method_id (int): The method ID (16 bits).
+            protocol_version (int): The protocol version (8 bits).
+            interface_version (int): The interface version (8 bits).
+            message_type (int): The message type (8 bits).
+            return_code (int): The return code (8 bits).
+            flags (int): The flags (8 bits).
+            reserved (int): The reserved field (24 bits).
+
+        Returns:
+            Callable[[int, int, bytes, bytes], bytes]: A function taking the
+            client ID, session ID, entries array and options array and returning
+            the encoded packet. Out of range IDs raise ``struct.error``.
+
+        Raises:
+            ValueError: If a shared field is out of range.
+        """
+        cls(
+            service_id,
+            method_id,
+            0,
+            0,
+            protocol_version,
+            interface_version,
+            message_type,
+            return_code,
+            flags,
+            reserved,
+            b"",
+            b"",
         )
-        series.frombytes(self.options_array)
+        pack_header = _HEADER.pack
+        pack_options_length = _OPTIONS_LENGTH.pack
+        flags_reserved = flags << 24 | reserved
+
+        def encode(
+            client_id: int,
+            session_id: int,
+            entries_array: bytes,
+            options_array: bytes,
+        ) -> bytes:
+            length_of_entries_array = len(entries_array)
+            length_of_options_array = len(options_array)
+            return b"".join(
+                (
+                    pack_header(
+                        service_id,
+                        method_id,
+                        _MINIMUM_LENGTH
+                        + length_of_entries_array
+                        + length_of_options_array,
+                        client_id,
+                        session_id,
+                        protocol_version,
+                        interface_version,
+                        message_type,
+                        return_code,
+                        flags_reserved,
+                        length_of_entries_array,
+                    ),
+                    entries_array,
+                    pack_options_length(length_of_options_array),
+                    options_array,
+                )
+            )
+
+        return encode
+
+    @staticmethod
+    def view(series: bytes) -> "PacketView":
+        """Creates a read-only view over an encoded packet without decoding it.
+
+        Args:
+            series (bytes): The byte sequence holding the packet. It is not
+                copied, so it must not change while the view is in use.
 
-        return series.tobytes()
+        Returns:
+            PacketView: The view over the packet.
+
+        Raises:
+            ValueError: If the byte sequence is of invalid length.
+        """
+        # Imported here because packet_view builds on this module.
+        from protocol.someipsd.packet_view import PacketView
+
+        return PacketView(series)
 
     @classmethod
     def decode(cls, series: bytes) -> "Packet":
@@ -199,28 +418,36 @@ class Packet:
         Raises:
             ValueError: If the byte sequence is of invalid length.
         """
-        packet = bitarray()
-        packet.frombytes(series)
-
-        if len(packet) < cls.expected_minimum_length():
+        if len(series) < _HEADER.size:
             raise ValueError("Invalid SOME/IP SD minimum length")
 
-        reader = SeriesReader(packet)
-        service_id = ba2int(reader.read(Length.SERVICE_ID))
-        method_id = ba2int(reader.read(Length.METHOD_ID))
-        _ = ba2int(reader.read(Length.LENGTH))
-        client_id = ba2int(reader.read(Length.CLIENT_ID))
-        session_id = ba2int(reader.read(Length.SESSION_ID))
-        protocol_version = ba2int(reader.read(Length.PROTOCOL_VERSION))
-        interface_version = ba2int(reader.read(Length.INTERFACE_VERSION))
-        message_type = ba2int(reader.read(Length.MESSAGE_TYPE))
-        return_code = ba2int(reader.read(Length.RETURN_CODE))
-        flags = ba2int(reader.read(Length.FLAGS))
-        reserved = ba2int(reader.read(Length.RESERVED))
-        length_of_entries_array = ba2int(reader.read(Length.LENGTH_OF_ENTRIES_ARRAY))
-        entries_array = reader.read(length_of_entries_array * 8).tobytes()
-        length_of_options_array = ba2int(reader.read(Length.LENGTH_OF_OPTIONS_ARRAY))
-        options_array = reader.read(length_of_options_array * 8).tobytes()
+        (
+            service_id,
+            method_id,
+            _,
+            client_id,
+            session_id,
+            protocol_version,
+            interface_version,
+            message_type,
+            return_code,
+            flags_reserved,
+            length_of_entries_array,
+        ) = _HEADER.unpack_from(series, 0)
+        flags = flags_reserved >> 24
+        reserved = flags_reserved & 0xFFFFFF
+
+        # Slice through a memoryview so each array is copied exactly once.
+        view = memoryview(series)
+        offset = _HEADER.size + length_of_entries_array
+        if len(series) < offset + _OPTIONS_LENGTH.size:
+            raise ValueError("Invalid SOME/IP SD entries array length")
+        entries_array = bytes(view[_HEADER.size : offset])
+        (length_of_options_array,) = _OPTIONS_LENGTH.unpack_from(series, offset)
+        offset += _OPTIONS_LENGTH.size
+        if len(series) < offset + length_of_options_array:
+            raise ValueError("Invalid SOME/IP SD options array length")
+        options_array = bytes(view[offset : offset + length_of_options_array])
 
         return cls(
             service_id=service_id,
@@ -239,22 +466,20 @@ class Packet:
 
     def __repr__(self) -> str:
         """Returns a string representation of the Packet object."""
-        return "\n".join(
-            (
-                f"{'service id':<24}: {self.service_id}",
-                f"{'method id':<24}: {self.method_id}",
-                f"{'length':<24}: {self.length}",
-                f"{'client id':<24}: {self.client_id}",
-                f"{'session id':<24}: {self.session_id}",
-                f"{'protocol version':<24}: {self.protocol_version}",
-                f"{'interface version':<24}: {self.interface_version}",
-                f"{'message type':<24}: {self.message_type}",
-                f"{'return code':<24}: {self.return_code}",
-                f"{'flags':<24}: {self.flags}",
-                f"{'reserved':<24}: {self.reserved}",
-                f"{'length of entries array':<24}: {self.length_of_entries_array}",
-                f"{'entries array':<24}: {self.entries_array}",
-                f"{'length of options array':<24}: {self.length_of_options_array}",
-                f"{'options array':<24}: {self.options_array}",
-            )
+        return _REPR.format(
+            self.__service_id,
+            self.__method_id,
+            self.__length,
+            self.__client_id,
+            self.__session_id,
+            self.__protocol_version,
+            self.__interface_version,
+            self.__message_type,
+            self.__return_code,
+            self.__flags,
+            self.__reserved,
+            self.__length_of_entries_array,
+            self.__entries_array,
+            self.__length_of_options_array,
+            self.__options_array,
         )
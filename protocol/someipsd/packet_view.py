@@ -0,0 +1,144 @@
+__all__ = ["PacketView"]
+
+
+import struct
+
+from protocol.someipsd.packet import _HEADER, _OPTIONS_LENGTH, Packet
+
+# Same layout as an encoded SOME/IP SD packet, see Packet. Every field is read
+# at its fixed offset only when it is accessed.
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+_HEADER_SIZE = _HEADER.size
+_OPTIONS_LENGTH_SIZE = _OPTIONS_LENGTH.size
+# The entries array length is the last word of the header struct.
+_ENTRIES_LENGTH_OFFSET = _HEADER_SIZE - _U32.size
+
+
+class PacketView:
+    """
+    Read-only view of an encoded SOME/IP SD packet.
+
+    The buffer is bounds-checked once when the view is created; each header
+    field is then unpacked on access and the arrays are copied out only when
+    they are read. For paths that inspect a few fields and drop most packets
+    this avoids building a ``Packet``. ``to_packet`` decodes the full packet.
+    ``Packet.view`` creates one.
+    """
+
+    __slots__ = (
+        "__view",
+        "__length_of_entries_array",
+        "__length_of_options_array",
+    )
+
+    def __init__(self, series: bytes) -> None:
+        """Initializes a view over an encoded packet.
+
+        Args:
+            series (bytes): The byte sequence holding the packet. It is not
+                copied, so it must not change while the view is in use.
+
+        Raises:
+            ValueError: If the byte sequence is of invalid length.
+        """
+        view = memoryview(series)
+        if len(view) < _HEADER_SIZE:
+            raise ValueError("Invalid SOME/IP SD minimum length")
+        (length_of_entries_array,) = _U32.unpack_from(view, _ENTRIES_LENGTH_OFFSET)
+        offset = _HEADER_SIZE + length_of_entries_array
+        if len(view) < offset + _OPTIONS_LENGTH_SIZE:
+            raise ValueError("Invalid SOME/IP SD entries array length")
+        (length_of_options_array,) = _OPTIONS_LENGTH.unpack_from(view, offset)
+        if len(view) < offset + _OPTIONS_LENGTH_SIZE + length_of_options_array:
+            raise ValueError("Invalid SOME/IP SD options array length")
+
+        self.__view = view
+        self.__length_of_entries_array = length_of_entries_array
+        self.__length_of_options_array = length_of_options_array
+
+    @property
+    def service_id(self) -> int:
+        """Returns the service ID."""
+        return _U16.unpack_from(self.__view, 0)[0]
+
+    @property
+    def method_id(self) -> int:
+        """Returns the method ID."""
+        return _U16.unpack_from(self.__view, 2)[0]
+
+    @property
+    def length(self) -> int:
+        """Returns the length field of the packet."""
+        return _U32.unpack_from(self.__view, 4)[0]
+
+    @property
+    def client_id(self) -> int:
+        """Returns the client ID."""
+        return _U16.unpack_from(self.__view, 8)[0]
+
+    @property
+    def session_id(self) -> int:
+        """Returns the session ID."""
+        return _U16.unpack_from(self.__view, 10)[0]
+
+    @property
+    def protocol_version(self) -> int:
+        """Returns the protocol version."""
+        return self.__view[12]
+
+    @property
+    def interface_version(self) -> int:
+        """Returns the interface version."""
+        return self.__view[13]
+
+    @property
+    def message_type(self) -> int:
+        """Returns the message type."""
+        return self.__view[14]
+
+    @property
+    def return_code(self) -> int:
+        """Returns the return code."""
+        return self.__view[15]
+
+    @property
+    def flags(self) -> int:
+        """Returns the flags."""
+        return self.__view[16]
+
+    @property
+    def reserved(self) -> int:
+        """Returns the reserved field."""
+        return _U32.unpack_from(self.__view, 16)[0] & 0xFFFFFF
+
+    @property
+    def length_of_entries_array(self) -> int:
+        """Returns the length of the entries array."""
+        return self.__length_of_entries_array
+
+    @property
+    def entries_array(self) -> bytes:
+        """Returns a copy of the entries array."""
+        return bytes(
+            self.__view[_HEADER_SIZE : _HEADER_SIZE + self.__length_of_entries_array]
+        )
+
+    @property
+    def length_of_options_array(self) -> int:
+        """Returns the length of the options array."""
+        return self.__length_of_options_array
+
+    @property
+    def options_array(self) -> bytes:
+        """Returns a copy of the options array."""
+        offset = _HEADER_SIZE + self.__length_of_entries_array + _OPTIONS_LENGTH_SIZE
+        return bytes(self.__view[offset : offset + self.__length_of_options_array])
+
+    def to_packet(self) -> Packet:
+        """Decodes the viewed bytes into a Packet object.
+
+        Returns:
+            Packet: The decoded Packet object.
+        """
+        return Packet.decode(self.__view)
@@ -1,4 +1,16 @@
-__all__ = ["MessageType"]
+__all__ = [
+    "MessageType",
+    "REQUEST",
+    "REQUEST_NO_RETURN",
+    "NOTIFICATION",
+    "RESPONSE",
+    "ERROR",
+    "TP_REQUEST",
+    "TP_REQUEST_NO_RETURN",
+    "TP_NOTIFICATION",
+    "TP_RESPONSE",
+    "TP_ERROR",
+]
 
 
 from enum import IntEnum
@@ -34,3 +46,17 @@ class MessageType(IntEnum):
     TP_NOTIFICATION = 0x22
     TP_RESPONSE = 0xA0
     TP_ERROR = 0xA1
+
+
+# Plain int values of the members, for encode/decode paths that build or compare
+# message type fields without going through IntEnum member lookup and dispatch.
+REQUEST = MessageType.REQUEST.value
+REQUEST_NO_RETURN = MessageType.REQUEST_NO_RETURN.value
+NOTIFICATION = MessageType.NOTIFICATION.value
+RESPONSE = MessageType.RESPONSE.value
+ERROR = MessageType.ERROR.value
+TP_REQUEST = MessageType.TP_REQUEST.value
+TP_REQUEST_NO_RETURN = MessageType.TP_REQUEST_NO_RETURN.value
+TP_NOTIFICATION = MessageType.TP_NOTIFICATION.value
+TP_RESPONSE = MessageType.TP_RESPONSE.value
+TP_ERROR = MessageType.TP_ERROR.value
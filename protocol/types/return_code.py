@@ -1,4 +1,26 @@
-__all__ = ["ReturnCode"]
+__all__ = [
+    "ReturnCode",
+    "E_OK",
+    "E_NOT_OK",
+    "E_UNKNOWN_SERVICE",
+    "E_UNKNOWN_METHOD",
+    "E_NOT_READY",
+    "E_NOT_REACHABLE",
+    "E_TIMEOUT",
+    "E_WRONG_PROTOCOL_VERSION",
+    "E_WRONG_INTERFACE_VERSION",
+    "E_MALFORMED_MESSAGE",
+    "E_WRONG_MESSAGE_TYPE",
+    "E_E2E_REPEATED",
+    "E_E2E_WRONG_SEQUENCE",
+    "E_E2E",
+    "E_E2E_NOT_AVAILABLE",
+    "E_E2E_NO_NEW_DATA",
+    "RESERVED_GENERIC_START",
+    "RESERVED_GENERIC_END",
+    "RESERVED_SPECIFIC_START",
+    "RESERVED_SPECIFIC_END",
+]
 
 
 from enum import IntEnum
@@ -53,3 +75,27 @@ class ReturnCode(IntEnum):
     RESERVED_GENERIC_END = 0x1F
     RESERVED_SPECIFIC_START = 0x20
     RESERVED_SPECIFIC_END = 0x5E
+
+
+# Plain int values of the members, for encode/decode paths that build or compare
+# return code fields without going through IntEnum member lookup and dispatch.
+E_OK = ReturnCode.E_OK.value
+E_NOT_OK = ReturnCode.E_NOT_OK.value
+E_UNKNOWN_SERVICE = ReturnCode.E_UNKNOWN_SERVICE.value
+E_UNKNOWN_METHOD = ReturnCode.E_UNKNOWN_METHOD.value
+E_NOT_READY = ReturnCode.E_NOT_READY.value
+E_NOT_REACHABLE = ReturnCode.E_NOT_REACHABLE.value
+E_TIMEOUT = ReturnCode.E_TIMEOUT.value
+E_WRONG_PROTOCOL_VERSION = ReturnCode.E_WRONG_PROTOCOL_VERSION.value
+E_WRONG_INTERFACE_VERSION = ReturnCode.E_WRONG_INTERFACE_VERSION.value
+E_MALFORMED_MESSAGE = ReturnCode.E_MALFORMED_MESSAGE.value
+E_WRONG_MESSAGE_TYPE = ReturnCode.E_WRONG_MESSAGE_TYPE.value
+E_E2E_REPEATED = ReturnCode.E_E2E_REPEATED.value
+E_E2E_WRONG_SEQUENCE = ReturnCode.E_E2E_WRONG_SEQUENCE.value
+E_E2E = ReturnCode.E_E2E.value
+E_E2E_NOT_AVAILABLE = ReturnCode.E_E2E_NOT_AVAILABLE.value
+E_E2E_NO_NEW_DATA = ReturnCode.E_E2E_NO_NEW_DATA.value
+RESERVED_GENERIC_START = ReturnCode.RESERVED_GENERIC_START.value
+RESERVED_GENERIC_END = ReturnCode.RESERVED_GENERIC_END.value
+RESERVED_SPECIFIC_START = ReturnCode.RESERVED_SPECIFIC_START.value
+RESERVED_SPECIFIC_END = ReturnCode.RESERVED_SPECIFIC_END.value
@@ -1,17 +1,17 @@
 __all__ = ["Base"]
 
 
+import copy
 from abc import ABC, abstractmethod
 from logging import Logger
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
-import toml
-
 from core.allocator import Allocator
 from core.environment import Environment
 from core.part import Part
 from core.transceiver import Transceiver
+from utils import load_toml
 
 
 class Base(ABC):
@@ -19,6 +19,14 @@ class Base(ABC):
     functionality for setting up and managing test environments, parts,
     and resources needed for tests."""
 
+    __slots__ = (
+        "__environment",
+        "__part",
+        "__allocator",
+        "__transceiver",
+        "__logger",
+    )
+
     def __init__(
         self,
         environment: Environment,
@@ -74,9 +82,10 @@ class Base(ABC):
 
         Returns:
             Dict[str, Any]: A dictionary containing the fields loaded from the file.
+            The parsed file is cached while it is unchanged; each call returns
+            its own copy, so callers may mutate it freely.
         """
-        fields = toml.load(path)
-        return fields
+        return copy.deepcopy(load_toml(path))
 
     def combine_fields(
         self, local: Tuple[str, int], *fields: Dict[str, Any]
@@ -1,5 +1,6 @@
-__all__ = ["singleton", "SeriesReader"]
+__all__ = ["singleton", "SeriesReader", "load_toml"]
 
 
 from utils.series_reader import SeriesReader
 from utils.singleton import singleton
+from utils.toml_loader import load_toml
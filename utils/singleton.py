@@ -23,7 +23,9 @@ def singleton(cls):
         >>> a is b
         True
     """
-    instances = {}
+    # The instance is held in the closure, so each call is one local check
+    # rather than a dictionary lookup keyed by the class.
+    instance = None
 
     def get_instance(*args, **kwargs):
         """
@@ -36,8 +38,9 @@ def singleton(cls):
         Returns:
             object: A single instance of the decorated class.
         """
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        if instance is None:
+            instance = cls(*args, **kwargs)
+        return instance
 
     return get_instance
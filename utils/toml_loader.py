@@ -0,0 +1,39 @@
+__all__ = ["load_toml"]
+
+
+import functools
+from pathlib import Path
+from typing import Any, Dict
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+
+# Every edit of a file adds a new (path, mtime) key, so the cache is bounded and
+# entries for superseded versions are evicted as least recently used.
+@functools.lru_cache(maxsize=64)
+def _parse_toml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parses a TOML file. Memoized per (path, modification time)."""
+    with open(path, "rb") as file:
+        return tomllib.load(file)
+
+
+def load_toml(path: Path) -> Dict[str, Any]:
+    """
+    Loads a TOML file, reusing the parsed result while the file is unchanged.
+
+    The cache is keyed by the absolute path and the file's modification time,
+    so an edited file is parsed again while repeated loads of an unchanged file
+    only cost a ``stat`` call.
+
+    Args:
+        path (Path): Path to the TOML file.
+
+    Returns:
+        Dict[str, Any]: The parsed content. The object is shared between callers
+        and must not be mutated.
+    """
+    resolved = Path(path).resolve()
+    return _parse_toml(str(resolved), resolved.stat().st_mtime_ns)